@@ -2,17 +2,63 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import hashlib
+import re
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List
 import logging
-from config import REPORT_CONFIG, COLOR_STATUS_MAP
+from config import REPORT_CONFIG, COLOR_STATUS_MAP, STATUS_COLORS
+from data_processor import select_extreme
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Serialize figures with orjson when it is installed
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# Marker traces with more points than this are rendered with WebGL
+WEBGL_POINT_THRESHOLD = 2000
+
+# Maximum number of points drawn for a single time series
+M4_TARGET_POINTS = 2000
+
+# Load plotly.js from the CDN instead of inlining ~3MB into every file
+HTML_WRITE_OPTIONS = dict(include_plotlyjs='cdn', validate=False)
+
+# Status color lookup; unknown statuses get code -1, i.e. the trailing 'gray'
+_STATUS_CATEGORIES = np.array(list(STATUS_COLORS))
+_STATUS_COLOR_ARR = np.array(list(STATUS_COLORS.values()) + ['gray'])
+
+# Hover templates for the project scatter plots
+_HOVER_SCATTER = '%{text}<br>Cost: %{x:,.0f}<br>Revenue: %{y:,.0f}'
+_HOVER_EFFICIENCY = (
+    '%{text}<br>'
+    'Hours: %{x:,.0f}<br>'
+    'Efficiency: %{y:,.0f}<br>'
+    'Size: Contract Price'
+)
+
+# Week label (e.g. '7/1') at the start of a work hour date range
+_WEEK_RE = re.compile(r'(\d+/\d+)')
+
+
+@lru_cache(maxsize=8)
+def _colors_for(statuses: tuple) -> tuple:
+    """Chart colors for a tuple of status labels (cached per status set)"""
+    codes = pd.Categorical(list(statuses), categories=_STATUS_CATEGORIES).codes
+    return tuple(_STATUS_COLOR_ARR[codes].tolist())
+
 
 class Visualizer:
     """Create visualizations for financial analysis"""
@@ -20,32 +66,85 @@ class Visualizer:
     def __init__(self, financial_summary_df: pd.DataFrame, 
                  department_summary_df: pd.DataFrame,
                  work_hours_df: pd.DataFrame):
-        self.financial_summary = financial_summary_df
+        # Low-cardinality labels as categoricals: integer-code masks and groupbys
+        self.financial_summary = financial_summary_df.astype({
+            col: 'category' for col in ('ProjectType', 'Status')
+            if col in financial_summary_df.columns
+            and not isinstance(financial_summary_df[col].dtype, pd.CategoricalDtype)
+        })
         self.department_summary = department_summary_df
         self.work_hours = work_hours_df
         
+        # Extract week labels once; done here rather than in the time series
+        # builder because chart builders read work_hours concurrently
+        if 'Week' not in self.work_hours.columns:
+            self.work_hours['Week'] = self.work_hours['Date'].str.extract(
+                _WEEK_RE, expand=False
+            )
+        
+        # GS subset and its status aggregates are shared by several charts
+        self._gs_projects = self.financial_summary.loc[
+            self.financial_summary['ProjectType'].values == 'GS'
+        ]
+        status_counts = self._gs_projects['Status'].value_counts()
+        self._status_counts_gs = status_counts[status_counts > 0]
+        self._status_metrics_gs = self._status_aggregates(self._gs_projects)
+        
+        # ProjectCode -> EfficiencyScore, mapped onto work hours by department
+        self._efficiency_by_project = (self.financial_summary
+                                       .drop_duplicates('ProjectCode')
+                                       .set_index('ProjectCode')['EfficiencyScore'])
+        
+        # SVG scatter slows down with many points; use WebGL for large inputs
+        self._scatter_cls = (go.Scattergl
+                             if len(self.financial_summary) > WEBGL_POINT_THRESHOLD
+                             else go.Scatter)
+        
         # Create output directories
         self.output_dir = REPORT_CONFIG['visualizations_dir']
         os.makedirs(self.output_dir, exist_ok=True)
         
-    def create_all_visualizations(self):
-        """Generate all visualizations"""
+    def create_all_visualizations(self, force: bool = False):
+        """Generate all visualizations, skipping those whose inputs are unchanged"""
         logger.info("Creating visualizations...")
         
-        # Main dashboard
-        self.create_main_dashboard()
+        builders = {
+            'main_dashboard.html': self.create_main_dashboard,
+            'profitability_analysis.html': self.create_profitability_charts,
+            'efficiency_analysis.html': self.create_efficiency_analysis,
+            'department_analysis.html': self.create_department_analysis,
+            'project_status_analysis.html': self.create_project_status_analysis,
+            'time_series_analysis.html': self.create_time_series_analysis
+        }
         
-        # Individual visualizations
-        self.create_profitability_charts()
-        self.create_efficiency_analysis()
-        self.create_department_analysis()
-        self.create_project_status_analysis()
-        self.create_time_series_analysis()
+        key = self._inputs_hash()
+        tasks = {}
+        for name, builder in builders.items():
+            if not force and self._is_cached(name, key):
+                logger.info(f"{name} is up to date, skipping")
+                continue
+            tasks[name] = builder
+        
+        # Builders only read the summaries and each writes its own file,
+        # so they can run concurrently
+        if tasks:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {name: executor.submit(task) for name, task in tasks.items()}
+                for name, future in futures.items():
+                    # Builders return False when they have no data to chart
+                    if future.result():
+                        self._save_cache(name, key)
+                    else:
+                        self._clear_cache(name)
         
         logger.info(f"All visualizations saved to {self.output_dir}")
     
-    def create_main_dashboard(self):
+    def create_main_dashboard(self) -> bool:
         """Create main financial dashboard"""
+        if self.financial_summary.empty:
+            logger.warning("No project data found for main dashboard")
+            return False
+        
         fig = make_subplots(
             rows=3, cols=2,
             subplot_titles=(
@@ -67,12 +166,12 @@ class Visualizer:
         )
         
         # 1. Top 10 Projects by Profit
-        top_projects = self.financial_summary.nlargest(10, 'Profit')
+        top_projects = select_extreme(self.financial_summary, 'Profit', 10)
         fig.add_trace(
             go.Bar(
                 x=top_projects['ProjectCode'],
                 y=top_projects['Profit'],
-                text=top_projects['Profit'].round(0).astype(str),
+                text=self._fmt0(top_projects['Profit']),
                 textposition='outside',
                 marker_color='lightgreen',
                 name='Profit'
@@ -81,22 +180,13 @@ class Visualizer:
         )
         
         # 2. Project Status Distribution (GS projects only)
-        gs_projects = self.financial_summary[self.financial_summary['ProjectType'] == 'GS']
-        status_counts = gs_projects['Status'].value_counts()
-        
-        colors = {
-            'Success': 'green',
-            'Negotiation': 'darkgreen',
-            'In Progress': 'lightgray',
-            'Fail': 'red',
-            'Unknown': 'blue'
-        }
+        status_counts = self._status_counts_gs
         
         fig.add_trace(
             go.Pie(
                 labels=status_counts.index,
                 values=status_counts.values,
-                marker=dict(colors=[colors.get(s, 'gray') for s in status_counts.index]),
+                marker=dict(colors=self._status_colors(status_counts.index)),
                 textinfo='label+percent',
                 name='Status'
             ),
@@ -116,29 +206,30 @@ class Visualizer:
         )
         
         # 4. Profit Margin Distribution by Project Type
-        for ptype in self.financial_summary['ProjectType'].unique():
-            type_data = self.financial_summary[
-                (self.financial_summary['ProjectType'] == ptype) &
-                (self.financial_summary['ProfitMargin'].notna())
-            ]
-            fig.add_trace(
-                go.Box(
-                    y=type_data['ProfitMargin'],
-                    name=ptype,
-                    boxpoints='outliers'
-                ),
-                row=2, col=2
-            )
+        margin_mask = self.financial_summary['ProfitMargin'].notna()
+        fig.add_trace(
+            go.Box(
+                x=self.financial_summary.loc[margin_mask, 'ProjectType'],
+                y=self.financial_summary.loc[margin_mask, 'ProfitMargin'],
+                boxpoints='outliers',
+                name='Profit Margin'
+            ),
+            row=2, col=2
+        )
         
         # 5. Revenue vs Cost Scatter
+        # Money stays float64; float32 misstates whole yuan above ~16.7M
+        total_cost = self.financial_summary['TotalCost'].to_numpy(dtype=np.float64)
+        contract_price = self.financial_summary['ContractPrice'].to_numpy(dtype=np.float64)
+        profit_margin = self.financial_summary['ProfitMargin'].to_numpy(dtype=np.float64)
         fig.add_trace(
-            go.Scatter(
-                x=self.financial_summary['TotalCost'],
-                y=self.financial_summary['ContractPrice'],
+            self._scatter_cls(
+                x=total_cost,
+                y=contract_price,
                 mode='markers',
                 marker=dict(
                     size=8,
-                    color=self.financial_summary['ProfitMargin'],
+                    color=profit_margin,
                     colorscale='RdYlGn',
                     showscale=True,
                     colorbar=dict(
@@ -149,15 +240,14 @@ class Visualizer:
                     )
                 ),
                 text=self.financial_summary['ProjectCode'],
-                hovertemplate='%{text}<br>Cost: %{x:,.0f}<br>Revenue: %{y:,.0f}',
+                hovertemplate=_HOVER_SCATTER,
                 name='Projects'
             ),
             row=3, col=1
         )
         
         # Add break-even line
-        max_val = max(self.financial_summary['TotalCost'].max(), 
-                     self.financial_summary['ContractPrice'].max())
+        max_val = float(np.nanmax(np.fmax(total_cost, contract_price)))
         fig.add_trace(
             go.Scatter(
                 x=[0, max_val],
@@ -171,9 +261,13 @@ class Visualizer:
         )
         
         # 6. Department Efficiency
-        dept_efficiency = self.work_hours.groupby('Department').apply(
-            lambda x: self._calculate_dept_efficiency(x)
-        ).sort_values(ascending=False)
+        eff_map = self._efficiency_by_project
+        dept_efficiency = (self.work_hours
+                           .assign(Eff=self.work_hours['ProjectCode'].map(eff_map))
+                           .drop_duplicates(['Department', 'ProjectCode'])
+                           .groupby('Department')['Eff'].mean()
+                           .fillna(0)
+                           .sort_values(ascending=False))
         
         fig.add_trace(
             go.Bar(
@@ -208,26 +302,50 @@ class Visualizer:
         
         # Save
         output_path = os.path.join(self.output_dir, 'main_dashboard.html')
-        fig.write_html(output_path)
+        self._write_figure(fig, output_path)
         logger.info(f"Main dashboard saved to {output_path}")
+        return True
+    
+    def _inputs_hash(self) -> str:
+        """Content hash of the three input DataFrames"""
+        h = hashlib.blake2b(digest_size=16)
+        for df in (self.financial_summary, self.department_summary, self.work_hours):
+            h.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+        return h.hexdigest()
     
-    def _calculate_dept_efficiency(self, dept_data: pd.DataFrame) -> float:
-        """Calculate average efficiency for department projects"""
-        projects = dept_data['ProjectCode'].unique()
-        efficiencies = []
-        
-        for project in projects:
-            if project in self.financial_summary['ProjectCode'].values:
-                eff = self.financial_summary[
-                    self.financial_summary['ProjectCode'] == project
-                ]['EfficiencyScore'].values
-                if len(eff) > 0:
-                    efficiencies.append(eff[0])
-        
-        return np.mean(efficiencies) if efficiencies else 0
+    def _cache_path(self, name: str) -> str:
+        """Path of the sidecar file holding the input hash of an output"""
+        return os.path.join(self.output_dir, name + '.hash')
     
-    def create_profitability_charts(self):
+    def _is_cached(self, name: str, key: str) -> bool:
+        """Check whether an output exists and was built from the same inputs"""
+        if not os.path.exists(os.path.join(self.output_dir, name)):
+            return False
+        try:
+            with open(self._cache_path(name), 'r', encoding='utf-8') as f:
+                return f.read().strip() == key
+        except OSError:
+            return False
+    
+    def _save_cache(self, name: str, key: str):
+        """Record the input hash an output was built from"""
+        with open(self._cache_path(name), 'w', encoding='utf-8') as f:
+            f.write(key)
+    
+    def _clear_cache(self, name: str):
+        """Remove a stale output and its hash sidecar"""
+        for path in (os.path.join(self.output_dir, name), self._cache_path(name)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def create_profitability_charts(self) -> bool:
         """Create profitability analysis charts"""
+        if self.financial_summary.empty:
+            logger.warning("No project data found for profitability analysis")
+            return False
+        
         fig = make_subplots(
             rows=2, cols=2,
             subplot_titles=(
@@ -250,12 +368,14 @@ class Visualizer:
         )
         
         # 2. Profit by Project Type
-        profit_by_type = self.financial_summary.groupby('ProjectType')['Profit'].sum()
+        profit_by_type = self.financial_summary.groupby(
+            'ProjectType', observed=True
+        )['Profit'].sum()
         fig.add_trace(
             go.Bar(
                 x=profit_by_type.index,
                 y=profit_by_type.values,
-                text=profit_by_type.values.round(0).astype(str),
+                text=self._fmt0(profit_by_type.values),
                 textposition='outside',
                 marker_color=['lightgreen', 'lightcoral']
             ),
@@ -263,9 +383,10 @@ class Visualizer:
         )
         
         # 3. Top Loss-Making Projects
-        loss_projects = self.financial_summary[
-            self.financial_summary['Profit'] < 0
-        ].nsmallest(10, 'Profit')
+        loss_projects = select_extreme(
+            self.financial_summary[self.financial_summary['Profit'] < 0],
+            'Profit', 10, largest=False
+        )
         
         if not loss_projects.empty:
             fig.add_trace(
@@ -273,7 +394,7 @@ class Visualizer:
                     x=loss_projects['Profit'],
                     y=loss_projects['ProjectCode'],
                     orientation='h',
-                    text=loss_projects['Profit'].round(0).astype(str),
+                    text=self._fmt0(loss_projects['Profit']),
                     textposition='outside',
                     marker_color='red'
                 ),
@@ -281,15 +402,17 @@ class Visualizer:
             )
         
         # 4. Profit Margin by Status
-        margin_by_status = self.financial_summary[
+        margin_by_status = (self.financial_summary[
             self.financial_summary['Status'] != 'Unknown'
-        ].groupby('Status')['ProfitMargin'].mean().sort_values(ascending=False)
+        ].groupby('Status', sort=False, observed=True)['ProfitMargin']
+         .mean()
+         .sort_values(ascending=False))
         
         fig.add_trace(
             go.Bar(
                 x=margin_by_status.index,
                 y=margin_by_status.values,
-                text=margin_by_status.values.round(1).astype(str) + '%',
+                text=self._fmt1(margin_by_status.values, '%'),
                 textposition='outside',
                 marker_color='lightyellow'
             ),
@@ -305,46 +428,54 @@ class Visualizer:
         
         # Save
         output_path = os.path.join(self.output_dir, 'profitability_analysis.html')
-        fig.write_html(output_path)
+        self._write_figure(fig, output_path)
         logger.info(f"Profitability analysis saved to {output_path}")
+        return True
     
-    def create_efficiency_analysis(self):
+    def create_efficiency_analysis(self) -> bool:
         """Create efficiency analysis visualizations"""
+        if self.financial_summary.empty:
+            logger.warning("No project data found for efficiency analysis")
+            return False
+        
         # Create figure
         fig = go.Figure()
         
+        # Plotted and fitted values stay float64; only the bubble sizes and
+        # colors, which are never shown as numbers, are narrowed to float32.
+        # Bubble area scales with contract price
+        hours = self.financial_summary['TotalHours'].to_numpy(dtype=np.float64)
+        efficiency = self.financial_summary['EfficiencyScore'].to_numpy(dtype=np.float64)
+        margins = self.financial_summary['ProfitMargin'].to_numpy(dtype=np.float32)
+        sizes = self.financial_summary['ContractPrice'].to_numpy(dtype=np.float32) * np.float32(1e-5)
+        sizeref = float(2.0 * np.nanmax(sizes) / (40.0 ** 2)) if sizes.size else 1.0
+        
         # Efficiency vs Hours scatter plot
         fig.add_trace(
-            go.Scatter(
-                x=self.financial_summary['TotalHours'],
-                y=self.financial_summary['EfficiencyScore'],
+            self._scatter_cls(
+                x=hours,
+                y=efficiency,
                 mode='markers',
                 marker=dict(
-                    size=self.financial_summary['ContractPrice'] / 100000,
-                    color=self.financial_summary['ProfitMargin'],
+                    size=sizes,
+                    color=margins,
                     colorscale='RdYlGn',
                     showscale=True,
                     colorbar=dict(title="Profit Margin %"),
                     sizemode='area',
-                    sizeref=2.*max(self.financial_summary['ContractPrice'] / 100000)/(40.**2),
+                    sizeref=sizeref,
                     sizemin=4
                 ),
                 text=self.financial_summary['ProjectCode'],
-                hovertemplate=(
-                    '%{text}<br>' +
-                    'Hours: %{x:,.0f}<br>' +
-                    'Efficiency: %{y:,.0f}<br>' +
-                    'Size: Contract Price'
-                )
+                hovertemplate=_HOVER_EFFICIENCY
             )
         )
         
         # Add trend line
         from scipy import stats
-        mask = (self.financial_summary['TotalHours'] > 0) & \
-               (self.financial_summary['EfficiencyScore'].notna())
-        x = self.financial_summary.loc[mask, 'TotalHours']
-        y = self.financial_summary.loc[mask, 'EfficiencyScore']
+        mask = (hours > 0) & ~np.isnan(efficiency)
+        x = hours[mask]
+        y = efficiency[mask]
         
         if len(x) > 2:
             slope, intercept, _, _, _ = stats.linregress(x, y)
@@ -370,11 +501,16 @@ class Visualizer:
         
         # Save
         output_path = os.path.join(self.output_dir, 'efficiency_analysis.html')
-        fig.write_html(output_path)
+        self._write_figure(fig, output_path)
         logger.info(f"Efficiency analysis saved to {output_path}")
+        return True
     
-    def create_department_analysis(self):
+    def create_department_analysis(self) -> bool:
         """Create department analysis visualizations"""
+        if self.department_summary.empty:
+            logger.warning("No department data found for department analysis")
+            return False
+        
         fig = make_subplots(
             rows=2, cols=2,
             subplot_titles=(
@@ -385,12 +521,25 @@ class Visualizer:
             )
         )
         
+        # Pull columns out once and derive ratios on plain arrays
+        ds = self.department_summary
+        depts = ds.index.to_numpy()
+        total_hours = ds['TotalHours'].to_numpy(dtype=np.float64)
+        labor_cost = ds['TotalLaborCost'].to_numpy(dtype=np.float64)
+        num_projects = ds['NumProjects'].to_numpy(dtype=np.float64)
+        hours_per_project = ds['HoursPerProject'].to_numpy(dtype=np.float64)
+        
+        # Projects per 1000 hours and labor cost per project
+        with np.errstate(divide='ignore', invalid='ignore'):
+            productivity = num_projects / total_hours * 1000.0
+            cost_per_project = labor_cost / num_projects
+        
         # 1. Department Labor Costs
         fig.add_trace(
             go.Bar(
-                x=self.department_summary.index,
-                y=self.department_summary['TotalLaborCost'],
-                text=self.department_summary['TotalLaborCost'].round(0).astype(str),
+                x=depts,
+                y=labor_cost,
+                text=self._fmt0(labor_cost),
                 textposition='outside',
                 marker_color='lightcoral'
             ),
@@ -400,9 +549,9 @@ class Visualizer:
         # 2. Hours per Project
         fig.add_trace(
             go.Bar(
-                x=self.department_summary.index,
-                y=self.department_summary['HoursPerProject'],
-                text=self.department_summary['HoursPerProject'].round(1).astype(str),
+                x=depts,
+                y=hours_per_project,
+                text=self._fmt1(hours_per_project),
                 textposition='outside',
                 marker_color='lightblue'
             ),
@@ -410,12 +559,9 @@ class Visualizer:
         )
         
         # 3. Department Productivity (Projects per 1000 hours)
-        productivity = (self.department_summary['NumProjects'] / 
-                       self.department_summary['TotalHours'] * 1000)
-        
         fig.add_trace(
             go.Scatter(
-                x=self.department_summary.index,
+                x=depts,
                 y=productivity,
                 mode='markers+lines',
                 marker=dict(size=10, color='green'),
@@ -425,14 +571,11 @@ class Visualizer:
         )
         
         # 4. Cost Efficiency
-        cost_per_project = (self.department_summary['TotalLaborCost'] / 
-                           self.department_summary['NumProjects'])
-        
         fig.add_trace(
             go.Bar(
-                x=self.department_summary.index,
+                x=depts,
                 y=cost_per_project,
-                text=cost_per_project.round(0).astype(str),
+                text=self._fmt0(cost_per_project),
                 textposition='outside',
                 marker_color='lightyellow'
             ),
@@ -451,25 +594,18 @@ class Visualizer:
         
         # Save
         output_path = os.path.join(self.output_dir, 'department_analysis.html')
-        fig.write_html(output_path)
+        self._write_figure(fig, output_path)
         logger.info(f"Department analysis saved to {output_path}")
+        return True
     
-    def create_project_status_analysis(self):
+    def create_project_status_analysis(self) -> bool:
         """Create project status analysis for GS projects"""
-        gs_projects = self.financial_summary[self.financial_summary['ProjectType'] == 'GS']
-        
-        if gs_projects.empty:
+        if self._gs_projects.empty:
             logger.warning("No GS projects found for status analysis")
-            return
+            return False
         
         # Status metrics
-        status_metrics = gs_projects.groupby('Status').agg({
-            'ProjectCode': 'count',
-            'ContractPrice': 'sum',
-            'Profit': 'sum',
-            'ProfitMargin': 'mean',
-            'TotalHours': 'sum'
-        }).rename(columns={'ProjectCode': 'Count'})
+        status_metrics = self._status_metrics_gs
         
         # Create subplots
         fig = make_subplots(
@@ -484,16 +620,7 @@ class Visualizer:
                    [{"type": "bar"}, {"type": "bar"}]]
         )
         
-        # Define colors
-        status_colors = {
-            'Success': 'green',
-            'Negotiation': 'darkgreen',
-            'In Progress': 'lightgray',
-            'Fail': 'red',
-            'Unknown': 'blue'
-        }
-        
-        colors = [status_colors.get(s, 'gray') for s in status_metrics.index]
+        colors = self._status_colors(status_metrics.index)
         
         # 1. Project count by status
         fig.add_trace(
@@ -522,7 +649,7 @@ class Visualizer:
             go.Bar(
                 x=status_metrics.index,
                 y=status_metrics['ProfitMargin'],
-                text=status_metrics['ProfitMargin'].round(1).astype(str) + '%',
+                text=self._fmt1(status_metrics['ProfitMargin'], '%'),
                 textposition='outside',
                 marker_color=colors
             ),
@@ -534,7 +661,7 @@ class Visualizer:
             go.Bar(
                 x=status_metrics.index,
                 y=status_metrics['TotalHours'],
-                text=status_metrics['TotalHours'].round(0).astype(str),
+                text=self._fmt0(status_metrics['TotalHours']),
                 textposition='outside',
                 marker_color=colors
             ),
@@ -550,18 +677,24 @@ class Visualizer:
         
         # Save
         output_path = os.path.join(self.output_dir, 'project_status_analysis.html')
-        fig.write_html(output_path)
+        self._write_figure(fig, output_path)
         logger.info(f"Project status analysis saved to {output_path}")
+        return True
     
-    def create_time_series_analysis(self):
+    def create_time_series_analysis(self) -> bool:
         """Create time series analysis of work patterns"""
-        # Extract week numbers from date ranges
-        self.work_hours['Week'] = self.work_hours['Date'].str.extract(r'(\d+/\d+)')
+        if self.work_hours.empty:
+            logger.warning("No work hour records found for time series analysis")
+            return False
         
-        # Aggregate by week
+        # Aggregate by week (Week column is prepared in __init__)
         weekly_hours = self.work_hours.groupby('Week')['Hours'].sum().sort_index()
         weekly_projects = self.work_hours.groupby('Week')['ProjectCode'].nunique()
         
+        # Reduce very long series to the points that are actually visible
+        if len(weekly_hours) > M4_TARGET_POINTS:
+            weekly_hours = self._m4_downsample(weekly_hours, M4_TARGET_POINTS)
+        
         # Create figure
         fig = make_subplots(
             rows=2, cols=1,
@@ -606,8 +739,63 @@ class Visualizer:
         
         # Save
         output_path = os.path.join(self.output_dir, 'time_series_analysis.html')
-        fig.write_html(output_path)
+        self._write_figure(fig, output_path)
         logger.info(f"Time series analysis saved to {output_path}")
+        return True
+    
+    @staticmethod
+    def _status_aggregates(projects: pd.DataFrame) -> pd.DataFrame:
+        """Aggregate count, revenue, profit, margin and hours per status"""
+        # Status is categorical, so this groups on its integer codes; groupby
+        # keeps the compensated sums the chart labels were built with
+        return projects.groupby('Status', observed=True).agg(
+            Count=('ProjectCode', 'count'),
+            ContractPrice=('ContractPrice', 'sum'),
+            Profit=('Profit', 'sum'),
+            ProfitMargin=('ProfitMargin', 'mean'),
+            TotalHours=('TotalHours', 'sum')
+        )
+    
+    @staticmethod
+    def _status_colors(statuses) -> List[str]:
+        """Map status labels to chart colors"""
+        return list(_colors_for(tuple(statuses)))
+    
+    @staticmethod
+    def _fmt0(values, suffix: str = '') -> np.ndarray:
+        """Format numbers as text labels with no decimals"""
+        return np.char.mod('%.0f' + suffix.replace('%', '%%'),
+                           np.asarray(values, dtype=np.float64))
+    
+    @staticmethod
+    def _fmt1(values, suffix: str = '') -> np.ndarray:
+        """Format numbers as text labels with one decimal"""
+        return np.char.mod('%.1f' + suffix.replace('%', '%%'),
+                           np.asarray(values, dtype=np.float64))
+    
+    @staticmethod
+    def _m4_downsample(series: pd.Series, target: int) -> pd.Series:
+        """Keep first, last, min and max of each bucket (M4 aggregation)"""
+        values = series.to_numpy()
+        n_buckets = max(target // 4, 1)
+        edges = np.linspace(0, len(values), n_buckets + 1).astype(int)
+        
+        keep = []
+        for start, end in zip(edges[:-1], edges[1:]):
+            if end <= start:
+                continue
+            bucket = values[start:end]
+            keep.extend((start, end - 1,
+                         start + int(np.argmin(bucket)),
+                         start + int(np.argmax(bucket))))
+        
+        return series.iloc[np.unique(keep)]
+    
+    @staticmethod
+    def _write_figure(fig: go.Figure, output_path: str):
+        """Render a figure to HTML and write it in one call"""
+        html = pio.to_html(fig, full_html=True, **HTML_WRITE_OPTIONS)
+        Path(output_path).write_text(html, encoding='utf-8')
 
 
 def main():
@@ -3,7 +3,11 @@ DB_CONFIG = {
     'host': 'localhost',
     'user': 'root',
     'password': 'password',
-    'database': 'wtl_financial_db'
+    'database': 'wtl_financial_db',
+    # Use the libmysqlclient-backed C extension instead of the pure-Python protocol
+    'use_pure': False,
+    # Needed for LOAD DATA LOCAL INFILE bulk loads of large summaries
+    'allow_local_infile': True
 }
 
 # Department salary information (synthetic data in CNY)
@@ -32,6 +36,15 @@ COLOR_STATUS_MAP = {
     'Yellow': 'Fail'
 }
 
+# Chart colors for each project status
+STATUS_COLORS = {
+    'Success': 'green',
+    'Negotiation': 'darkgreen',
+    'In Progress': 'lightgray',
+    'Fail': 'red',
+    'Unknown': 'blue'
+}
+
 #Change file path accordingly 
 EXCEL_FILE_PATH = r'C:\Users\arjun\Downloads\WTL Design Jr. Analyst Task.xlsx'
 
@@ -70,6 +83,7 @@ GS_COLOR_CODING = {
 REPORT_CONFIG = {
     'output_dir': 'reports',
     'visualizations_dir': 'visualizations',
+    'cache_dir': 'cache',
     'auto_report_template': 'report_template.json'
 }
 
@@ -1,7 +1,9 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 import logging
+import threading
+from collections.abc import Mapping
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.model_selection import train_test_split
 from config import DEPARTMENT_SALARIES, WORK_HOURS_PER_YEAR
@@ -10,6 +12,32 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def select_extreme(df: pd.DataFrame, column: str, n: int,
+                   largest: bool = True) -> pd.DataFrame:
+    """Rows with the n largest (or smallest) values of column, like nlargest/nsmallest"""
+    values = df[column].to_numpy(dtype=np.float64)
+    missing = np.isnan(values)
+    valid = np.flatnonzero(~missing)
+    keys = -values[valid] if largest else values[valid]
+    # Like nlargest, NaN rows only fill in once the valid rows run out
+    fill = np.flatnonzero(missing)[:max(0, n - keys.size)]
+    n = max(0, min(n, keys.size))
+    
+    if 0 < n < keys.size:
+        # Partial partition finds the cutoff in O(N); ties at the cutoff go to
+        # the earliest rows, as keep='first' does
+        cutoff = np.partition(keys, n - 1)[n - 1]
+        below = np.flatnonzero(keys < cutoff)
+        ties = np.flatnonzero(keys == cutoff)[:n - below.size]
+        chosen = np.sort(np.concatenate([below, ties]))
+    else:
+        chosen = np.arange(n)
+    
+    # Only the selected rows are sorted; stable so ties keep row order
+    order = chosen[np.argsort(keys[chosen], kind='stable')]
+    return df.iloc[np.concatenate([valid[order], fill])]
+
+
 class DataProcessor:
     """Process and calculate financial metrics"""
     
@@ -392,6 +420,33 @@ class DataProcessor:
                 [['ProjectCode', 'ProjectName', 'Profit', 'ProfitMargin', 'Status']])
 
 
+class LazyAnalyses(Mapping):
+    """Read-only analysis mapping whose entries are computed on first access"""
+    
+    def __init__(self, loaders: Dict[str, Callable[[], Any]]):
+        self._loaders = dict(loaders)
+        self._values = {}
+        self._lock = threading.Lock()
+    
+    def __getitem__(self, key):
+        # Reports read analyses from several threads; load each entry once.
+        # Mapping routes get(), values(), items() and dict(...) through here
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = self._loaders[key]()
+            return self._values[key]
+    
+    def __contains__(self, key):
+        # Membership must not trigger a load
+        return key in self._loaders
+    
+    def __iter__(self):
+        return iter(self._loaders)
+    
+    def __len__(self):
+        return len(self._loaders)
+
+
 def main():
     """Test data processing"""
     from data_loader import DataLoader
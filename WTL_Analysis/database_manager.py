@@ -1,9 +1,18 @@
 
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, errorcode, pooling
 import pandas as pd
+import numpy as np
+import copy
+import hashlib
 import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, List, Optional, Any
 import logging
 from config import DB_CONFIG, DEPARTMENT_SALARIES, WORK_HOURS_PER_YEAR
@@ -11,33 +20,119 @@ from config import DB_CONFIG, DEPARTMENT_SALARIES, WORK_HOURS_PER_YEAR
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson is optional; fall back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Rows per multi-row INSERT; keeps statements under max_allowed_packet
+# and under the 65,535 placeholder limit of prepared statements
+INSERT_CHUNK_SIZE = 5000
+
+# Summaries with at least this many rows are bulk-loaded with LOAD DATA
+LOAD_DATA_THRESHOLD = 50000
+
+# Column order shared by the INSERT and LOAD DATA paths
+FINANCIAL_SUMMARY_COLUMNS = [
+    'report_date', 'project_code', 'project_name', 'project_type', 'status',
+    'contract_price', 'purchase_cost', 'labor_cost', 'total_cost',
+    'profit', 'profit_margin', 'total_hours', 'efficiency_score'
+]
+
+# Bump when create_tables changes, and add a _migrate_to_v<N> step that
+# brings tables created by the previous version up to date
+SCHEMA_VERSION = 1
+
+# Summary tables are RANGE-partitioned by report_date so date-range reads
+# only touch the matching partitions; months are split off p_future
+PARTITIONED_TABLES = ['financial_summary', 'department_summary']
+PARTITION_CLAUSE = """
+    PARTITION BY RANGE (TO_DAYS(report_date)) (
+        PARTITION p_init VALUES LESS THAN (TO_DAYS('2025-01-01')),
+        PARTITION p_future VALUES LESS THAN MAXVALUE
+    )
+"""
+
+# Composite date indexes of the partitioned tables (schema version 1)
+DATE_INDEXES = {
+    'financial_summary': 'idx_date_type_status (report_date, project_type, status)',
+    'department_summary': ('idx_date_dept (report_date, department_name, total_hours, '
+                           'total_labor_cost, num_projects)')
+}
+
+# Warm connections shared by every DatabaseManager in the process with the
+# same connection config; each config gets its own pool
+POOL_NAME = 'wtl'
+POOL_SIZE = 10
+
 
 class DatabaseManager:
     """Manage database operations for WTL system"""
     
+    _pools = {}
+    
     def __init__(self, config: Dict[str, str] = DB_CONFIG):
         self.config = config
         self.connection = None
         self.cursor = None
+        self.prepared_cursor = None
+        
+        # Automated reports are reused until an insert bumps the data version
+        self._data_version = 0
+        self._report_cache = lru_cache(maxsize=32)(self._build_automated_report)
     
     def connect(self):
         """Establish database connection"""
+        if not mysql.connector.HAVE_CEXT:
+            logger.warning("MySQL C extension not available, using pure-Python driver")
+        
         try:
-            self.connection = mysql.connector.connect(**self.config)
+            self.connection = self._get_pool().get_connection()
             self.cursor = self.connection.cursor()
+            # Server-side prepared statements for the bulk inserts
+            self.prepared_cursor = self.connection.cursor(prepared=True)
             logger.info("Successfully connected to MySQL database")
         except Error as e:
             logger.error(f"Error connecting to MySQL: {e}")
             raise
     
+    def _get_pool(self) -> pooling.MySQLConnectionPool:
+        """Return the pool for this config, creating it on first use"""
+        key = hashlib.blake2b(repr(sorted(self.config.items())).encode(),
+                              digest_size=8).hexdigest()
+        pool = DatabaseManager._pools.get(key)
+        if pool is None:
+            # Autocommit off so inserts only land when transaction() commits
+            pool = DatabaseManager._pools[key] = pooling.MySQLConnectionPool(
+                pool_name=f"{POOL_NAME}_{key}", pool_size=POOL_SIZE,
+                **dict(self.config, autocommit=False)
+            )
+        return pool
+    
     def disconnect(self):
-        """Close database connection"""
+        """Return the connection to the pool"""
         if self.cursor:
             self.cursor.close()
+        if self.prepared_cursor:
+            self.prepared_cursor.close()
         if self.connection:
             self.connection.close()
+        # The connection now belongs to the pool again; drop our handles
+        self.connection = self.cursor = self.prepared_cursor = None
         logger.info("Database connection closed")
     
+    @contextmanager
+    def transaction(self):
+        """Commit everything inside the block at once, or roll it all back"""
+        try:
+            yield
+            self.connection.commit()
+        except Exception:
+            logger.error("Rolling back transaction")
+            self.connection.rollback()
+            raise
+    
     def create_database(self):
         """Create database if it doesn't exist"""
         try:
@@ -61,9 +156,9 @@ class DatabaseManager:
         """Create all necessary tables"""
         try:
             # Financial summary table for automated reports
-            self.cursor.execute("""
+            self.cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS financial_summary (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    id INT AUTO_INCREMENT,
                     report_date DATE NOT NULL,
                     project_code VARCHAR(50) NOT NULL,
                     project_name TEXT,
@@ -78,15 +173,16 @@ class DatabaseManager:
                     total_hours DECIMAL(10, 2),
                     efficiency_score DECIMAL(10, 2),
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_report_date (report_date),
+                    PRIMARY KEY (id, report_date),
+                    INDEX {DATE_INDEXES['financial_summary']},
                     INDEX idx_project_code (project_code)
-                )
+                ) {PARTITION_CLAUSE}
             """)
             
             # Department summary table
-            self.cursor.execute("""
+            self.cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS department_summary (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    id INT AUTO_INCREMENT,
                     report_date DATE NOT NULL,
                     department_name VARCHAR(50) NOT NULL,
                     total_hours DECIMAL(10, 2),
@@ -95,9 +191,10 @@ class DatabaseManager:
                     num_tasks INT,
                     avg_hourly_rate DECIMAL(10, 2),
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_report_date (report_date),
+                    PRIMARY KEY (id, report_date),
+                    INDEX {DATE_INDEXES['department_summary']},
                     INDEX idx_department (department_name)
-                )
+                ) {PARTITION_CLAUSE}
             """)
             
             # Automated reports log
@@ -121,50 +218,178 @@ class DatabaseManager:
             logger.error(f"Error creating tables: {e}")
             raise
     
-    def insert_financial_summary(self, summary_df: pd.DataFrame, report_date: str = None):
+    def _schema_version(self) -> int:
+        """Return the recorded schema version, 0 for a fresh database"""
+        try:
+            self.cursor.execute("SELECT MAX(version) FROM schema_version")
+            version = self.cursor.fetchall()[0][0]
+        except Error as e:
+            if e.errno != errorcode.ER_NO_SUCH_TABLE:
+                raise
+            return 0
+        return version or 0
+    
+    def ensure_schema(self):
+        """Create missing tables and migrate existing ones when the schema is outdated"""
+        version = self._schema_version()
+        if version >= SCHEMA_VERSION:
+            return
+        
+        # New tables are created at the latest layout; tables that already
+        # existed are upgraded one version at a time before the stamp
+        self.create_tables()
+        migrations = {1: self._migrate_to_v1}
+        for target in range(version + 1, SCHEMA_VERSION + 1):
+            migrations[target]()
+        
+        self.cursor.execute("CREATE TABLE IF NOT EXISTS schema_version (version INT NOT NULL)")
+        self.cursor.execute("INSERT INTO schema_version (version) VALUES (%s)", (SCHEMA_VERSION,))
+        self.connection.commit()
+        logger.info(f"Database schema migrated to version {SCHEMA_VERSION}")
+    
+    def _has_index(self, table: str, index: str) -> bool:
+        """Whether table has an index with this name"""
+        self.cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+        """, (table, index))
+        return self.cursor.fetchall()[0][0] > 0
+    
+    def _is_partitioned(self, table: str) -> bool:
+        """Whether table is partitioned"""
+        self.cursor.execute("""
+            SELECT COUNT(*) FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL
+        """, (table,))
+        return self.cursor.fetchall()[0][0] > 0
+    
+    def _migrate_to_v1(self):
+        """Add the composite keys, date indexes and partitions to pre-versioned tables"""
+        for table in PARTITIONED_TABLES:
+            # Pre-versioned tables still carry the single-column date index;
+            # the key swap is one ALTER so the AUTO_INCREMENT id stays keyed
+            if self._has_index(table, 'idx_report_date'):
+                self.cursor.execute(f"""
+                    ALTER TABLE {table}
+                        DROP PRIMARY KEY, ADD PRIMARY KEY (id, report_date),
+                        DROP INDEX idx_report_date,
+                        ADD INDEX {DATE_INDEXES[table]}
+                """)
+                logger.info(f"Migrated keys and indexes of {table}")
+            
+            # Partitioning needs report_date in the primary key, added above
+            if not self._is_partitioned(table):
+                self.cursor.execute(f"ALTER TABLE {table} {PARTITION_CLAUSE}")
+                logger.info(f"Partitioned {table} by report_date")
+    
+    def ensure_month_partition(self, report_date: str):
+        """Split report_date's month off the catch-all partition if not done yet"""
+        month = pd.Period(report_date, freq='M')
+        name = f"p{month.strftime('%Y%m')}"
+        upper = (month + 1).start_time.strftime('%Y-%m-%d')
+        
+        for table in PARTITIONED_TABLES:
+            self.cursor.execute("""
+                SELECT COUNT(*) FROM information_schema.PARTITIONS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME = %s
+            """, (table, name))
+            if self.cursor.fetchall()[0][0]:
+                continue
+            
+            try:
+                self.cursor.execute(f"""
+                    ALTER TABLE {table} REORGANIZE PARTITION p_future INTO (
+                        PARTITION {name} VALUES LESS THAN (TO_DAYS('{upper}')),
+                        PARTITION p_future VALUES LESS THAN MAXVALUE
+                    )
+                """)
+                logger.info(f"Added partition {name} to {table}")
+            except Error as e:
+                # Months older than the newest partition stay where they are
+                logger.warning(f"Could not add partition {name} to {table}: {e}")
+    
+    def _insert_chunked(self, insert_prefix: str, rows: List[tuple], chunksize: int):
+        """Insert rows through the prepared cursor, one multi-row INSERT per chunk"""
+        if not rows:
+            return
+        
+        row_placeholder = '(' + ', '.join(['%s'] * len(rows[0])) + ')'
+        full_query = insert_prefix + ', '.join([row_placeholder] * chunksize)
+        
+        # Full chunks reuse one prepared statement; only the tail is prepared separately
+        for start in range(0, len(rows), chunksize):
+            chunk = rows[start:start + chunksize]
+            query = full_query if len(chunk) == chunksize else \
+                insert_prefix + ', '.join([row_placeholder] * len(chunk))
+            self.prepared_cursor.execute(query, list(chain.from_iterable(chunk)))
+    
+    def _load_data_infile(self, table: str, columns: List[str], rows: List[tuple]):
+        """Bulk-load rows from a temporary CSV with LOAD DATA LOCAL INFILE"""
+        # Escape backslashes in text fields; NULLs are written as \N
+        frame = pd.DataFrame(rows, columns=columns).replace(r'\\', r'\\\\', regex=True)
+        
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False,
+                                         encoding='utf-8', newline='') as f:
+            frame.to_csv(f, index=False, header=False, na_rep='\\N', lineterminator='\n')
+            csv_path = f.name
+        
+        try:
+            self.cursor.execute(f"""
+                LOAD DATA LOCAL INFILE %s
+                INTO TABLE {table}
+                CHARACTER SET utf8mb4
+                FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"'
+                LINES TERMINATED BY '\\n'
+                ({', '.join(columns)})
+            """, (csv_path,))
+        finally:
+            os.remove(csv_path)
+    
+    def insert_financial_summary(self, summary_df: pd.DataFrame, report_date: str = None,
+                                 chunksize: int = INSERT_CHUNK_SIZE):
         """Insert financial summary data into database"""
         try:
             if report_date is None:
                 report_date = datetime.now().strftime('%Y-%m-%d')
             
             # Prepare data for insertion
-            insert_query = """
+            insert_query = f"""
                 INSERT INTO financial_summary 
-                (report_date, project_code, project_name, project_type, status,
-                 contract_price, purchase_cost, labor_cost, total_cost,
-                 profit, profit_margin, total_hours, efficiency_score)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            data_to_insert = []
-            for _, row in summary_df.iterrows():
-                data_to_insert.append((
-                    report_date,
-                    row['ProjectCode'],
-                    row['ProjectName'],
-                    row['ProjectType'],
-                    row.get('Status', 'Unknown'),
-                    float(row['ContractPrice']),
-                    float(row['PurchaseCost']),
-                    float(row.get('LaborCost', 0)),
-                    float(row['TotalCost']),
-                    float(row['Profit']),
-                    float(row['ProfitMargin']),
-                    float(row.get('TotalHours', 0)),
-                    float(row.get('EfficiencyScore', 0))
-                ))
-            
-            self.cursor.executemany(insert_query, data_to_insert)
-            self.connection.commit()
-            
+                ({', '.join(FINANCIAL_SUMMARY_COLUMNS)})
+                VALUES """
+            
+            # Cast each block of columns once instead of per value
+            num_cols = ['ContractPrice', 'PurchaseCost', 'LaborCost', 'TotalCost',
+                        'Profit', 'ProfitMargin', 'TotalHours', 'EfficiencyScore']
+            values = summary_df.reindex(columns=num_cols, fill_value=0).astype('float64').to_numpy().tolist()
+            texts = summary_df[['ProjectCode', 'ProjectName', 'ProjectType']].to_numpy().tolist()
+            statuses = summary_df.get('Status', pd.Series('Unknown', index=summary_df.index)).tolist()
+            
+            data_to_insert = [
+                (report_date, *text, status, *nums)
+                for text, status, nums in zip(texts, statuses, values)
+            ]
+            
+            loaded = False
+            if len(data_to_insert) >= LOAD_DATA_THRESHOLD:
+                try:
+                    self._load_data_infile('financial_summary', FINANCIAL_SUMMARY_COLUMNS, data_to_insert)
+                    loaded = True
+                except mysql.connector.DatabaseError as e:
+                    # Servers running with local_infile=OFF reject LOAD DATA LOCAL
+                    logger.warning(f"LOAD DATA LOCAL INFILE failed, inserting in chunks instead: {e}")
+            if not loaded:
+                self._insert_chunked(insert_query, data_to_insert, chunksize)
+            
+            self._data_version += 1
             logger.info(f"Inserted {len(data_to_insert)} records into financial_summary")
             
         except Error as e:
             logger.error(f"Error inserting financial summary: {e}")
-            self.connection.rollback()
             raise
     
-    def insert_department_summary(self, dept_summary_df: pd.DataFrame, report_date: str = None):
+    def insert_department_summary(self, dept_summary_df: pd.DataFrame, report_date: str = None,
+                                  chunksize: int = INSERT_CHUNK_SIZE):
         """Insert department summary data into database"""
         try:
             if report_date is None:
@@ -174,29 +399,24 @@ class DatabaseManager:
                 INSERT INTO department_summary 
                 (report_date, department_name, total_hours, total_labor_cost,
                  num_projects, num_tasks, avg_hourly_rate)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """
+                VALUES """
             
-            data_to_insert = []
-            for dept, row in dept_summary_df.iterrows():
-                data_to_insert.append((
-                    report_date,
-                    dept,
-                    float(row['TotalHours']),
-                    float(row['TotalLaborCost']),
-                    int(row['NumProjects']),
-                    int(row['NumTasks']),
-                    float(row['HourlyRate'])
-                ))
-            
-            self.cursor.executemany(insert_query, data_to_insert)
-            self.connection.commit()
+            floats = dept_summary_df[['TotalHours', 'TotalLaborCost', 'HourlyRate']].astype('float64').to_numpy().tolist()
+            ints = dept_summary_df[['NumProjects', 'NumTasks']].astype('int64').to_numpy().tolist()
             
+            data_to_insert = [
+                (report_date, dept, hours, cost, projects, tasks, rate)
+                for dept, (hours, cost, rate), (projects, tasks)
+                in zip(dept_summary_df.index.tolist(), floats, ints)
+            ]
+            
+            self._insert_chunked(insert_query, data_to_insert, chunksize)
+            
+            self._data_version += 1
             logger.info(f"Inserted {len(data_to_insert)} department records")
             
         except Error as e:
             logger.error(f"Error inserting department summary: {e}")
-            self.connection.rollback()
             raise
     
     def log_report(self, report_type: str, file_path: str, summary: Dict[str, Any]):
@@ -208,7 +428,12 @@ class DatabaseManager:
             """
             
             report_date = datetime.now().strftime('%Y-%m-%d')
-            summary_json = json.dumps(summary, ensure_ascii=False)
+            if orjson is not None:
+                summary_json = orjson.dumps(
+                    summary, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ).decode()
+            else:
+                summary_json = json.dumps(summary, ensure_ascii=False)
             
             self.cursor.execute(insert_query, (report_type, report_date, file_path, summary_json))
             self.connection.commit()
@@ -222,153 +447,183 @@ class DatabaseManager:
     
     def generate_automated_report(self, start_date: str = None, end_date: str = None) -> Dict:
         """Generate automated report from database"""
+        if start_date is None:
+            start_date = datetime.now().strftime('%Y-%m-01')
+        if end_date is None:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        
+        # Callers get their own copy of the cached report, stamped with this call's time
+        report = copy.deepcopy(self._report_cache(start_date, end_date, self._data_version))
+        report['generated_at'] = datetime.now().isoformat()
+        return report
+    
+    def _read_frame(self, query: str, params: tuple, numeric_cols: List[str],
+                    connection=None) -> pd.DataFrame:
+        """Run a query and return its rows as a frame with numeric columns as float64"""
+        if connection is None:
+            connection = self.connection
+        
+        # Fetch through a cursor; pandas only supports SQLAlchemy connectables
+        # and warns on a raw DBAPI connection
+        cursor = connection.cursor()
         try:
-            if start_date is None:
-                start_date = datetime.now().strftime('%Y-%m-01')
-            if end_date is None:
-                end_date = datetime.now().strftime('%Y-%m-%d')
-            
+            cursor.execute(query, params)
+            columns = [desc[0] for desc in cursor.description]
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+        
+        # Columns arrive as DOUBLE; the cast only matters for NULLs and empty results
+        frame = pd.DataFrame.from_records(rows, columns=columns)
+        return frame.astype(dict.fromkeys(numeric_cols, 'float64'))
+    
+    def _read_frame_pooled(self, query: str, params: tuple, numeric_cols: List[str]) -> pd.DataFrame:
+        """Run _read_frame on a second pooled connection so it can overlap with another read"""
+        connection = self._get_pool().get_connection()
+        try:
+            return self._read_frame(query, params, numeric_cols, connection)
+        finally:
+            connection.close()
+    
+    def _build_automated_report(self, start_date: str, end_date: str, data_version: int) -> Dict:
+        """Query the database for an automated report (data_version only keys the cache)"""
+        try:
+            # generated_at is stamped per call by generate_automated_report
             report = {
                 'report_period': f"{start_date} to {end_date}",
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': None,
                 'summary': {},
                 'trends': {},
                 'alerts': []
             }
             
-            # Overall summary
-            summary_query = """
+            # Load the period's rows in two round-trips and aggregate in pandas
+            # DECIMAL columns are cast to DOUBLE so the driver skips Decimal objects
+            fin_query = """
                 SELECT 
-                    COUNT(DISTINCT project_code) as total_projects,
-                    SUM(contract_price) as total_revenue,
-                    SUM(total_cost) as total_cost,
-                    SUM(profit) as total_profit,
-                    AVG(profit_margin) as avg_profit_margin,
-                    SUM(total_hours) as total_hours
+                    project_code, project_type, status,
+                    CAST(contract_price AS DOUBLE) AS contract_price,
+                    CAST(total_cost AS DOUBLE) AS total_cost,
+                    CAST(profit AS DOUBLE) AS profit,
+                    CAST(profit_margin AS DOUBLE) AS profit_margin,
+                    CAST(total_hours AS DOUBLE) AS total_hours,
+                    CAST(efficiency_score AS DOUBLE) AS efficiency_score
                 FROM financial_summary
                 WHERE report_date BETWEEN %s AND %s
             """
             
-            self.cursor.execute(summary_query, (start_date, end_date))
-            result = self.cursor.fetchone()
-            
-            if result:
-                report['summary'] = {
-                    'total_projects': int(result[0]) if result[0] else 0,
-                    'total_revenue': float(result[1]) if result[1] else 0,
-                    'total_cost': float(result[2]) if result[2] else 0,
-                    'total_profit': float(result[3]) if result[3] else 0,
-                    'avg_profit_margin': float(result[4]) if result[4] else 0,
-                    'total_hours': float(result[5]) if result[5] else 0
-                }
-            
-            # Project type breakdown
-            type_query = """
+            dept_query = """
                 SELECT 
-                    project_type,
-                    COUNT(*) as count,
-                    SUM(profit) as total_profit,
-                    AVG(profit_margin) as avg_margin
-                FROM financial_summary
+                    department_name,
+                    CAST(total_hours AS DOUBLE) AS total_hours,
+                    CAST(total_labor_cost AS DOUBLE) AS total_labor_cost,
+                    num_projects
+                FROM department_summary
                 WHERE report_date BETWEEN %s AND %s
-                GROUP BY project_type
             """
             
-            self.cursor.execute(type_query, (start_date, end_date))
-            type_results = self.cursor.fetchall()
+            # Both reads run concurrently, each on its own connection
+            params = (start_date, end_date)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                dept_future = executor.submit(self._read_frame_pooled, dept_query, params, [
+                    'total_hours', 'total_labor_cost', 'num_projects'
+                ])
+                fin = self._read_frame(fin_query, params, [
+                    'contract_price', 'total_cost', 'profit', 'profit_margin',
+                    'total_hours', 'efficiency_score'
+                ])
+                dept = dept_future.result()
             
-            report['project_types'] = {}
-            for row in type_results:
-                report['project_types'][row[0]] = {
-                    'count': int(row[1]),
-                    'total_profit': float(row[2]),
-                    'avg_margin': float(row[3])
+            # Overall summary
+            report['summary'] = {
+                'total_projects': int(fin['project_code'].nunique()),
+                'total_revenue': float(fin['contract_price'].sum()),
+                'total_cost': float(fin['total_cost'].sum()),
+                'total_profit': float(fin['profit'].sum()),
+                'avg_profit_margin': float(fin['profit_margin'].mean()) if fin['profit_margin'].count() else 0,
+                'total_hours': float(fin['total_hours'].sum())
+            }
+            
+            # Project type breakdown
+            type_stats = fin.groupby('project_type').agg(
+                count=('project_code', 'size'),
+                total_profit=('profit', 'sum'),
+                avg_margin=('profit_margin', 'mean')
+            )
+            
+            report['project_types'] = {
+                project_type: {
+                    'count': int(count),
+                    'total_profit': float(total_profit),
+                    'avg_margin': float(avg_margin)
                 }
+                for project_type, count, total_profit, avg_margin in zip(
+                    type_stats.index, type_stats['count'],
+                    type_stats['total_profit'], type_stats['avg_margin']
+                )
+            }
             
             # Status breakdown (GS projects)
-            status_query = """
-                SELECT 
-                    status,
-                    COUNT(*) as count,
-                    AVG(profit_margin) as avg_margin
-                FROM financial_summary
-                WHERE report_date BETWEEN %s AND %s
-                    AND project_type = 'GS'
-                    AND status != 'Unknown'
-                GROUP BY status
-            """
-            
-            self.cursor.execute(status_query, (start_date, end_date))
-            status_results = self.cursor.fetchall()
-            
-            report['project_status'] = {}
-            for row in status_results:
-                report['project_status'][row[0]] = {
-                    'count': int(row[1]),
-                    'avg_margin': float(row[2])
+            gs = fin[(fin['project_type'] == 'GS') & (fin['status'] != 'Unknown')]
+            status_stats = gs.groupby('status').agg(
+                count=('project_code', 'size'),
+                avg_margin=('profit_margin', 'mean')
+            )
+            
+            report['project_status'] = {
+                status: {
+                    'count': int(count),
+                    'avg_margin': float(avg_margin)
                 }
+                for status, count, avg_margin in zip(
+                    status_stats.index, status_stats['count'], status_stats['avg_margin']
+                )
+            }
             
             # Department performance
-            dept_query = """
-                SELECT 
-                    department_name,
-                    SUM(total_hours) as total_hours,
-                    SUM(total_labor_cost) as total_cost,
-                    AVG(num_projects) as avg_projects
-                FROM department_summary
-                WHERE report_date BETWEEN %s AND %s
-                GROUP BY department_name
-                ORDER BY total_hours DESC
-                LIMIT 10
-            """
-            
-            self.cursor.execute(dept_query, (start_date, end_date))
-            dept_results = self.cursor.fetchall()
-            
-            report['top_departments'] = []
-            for row in dept_results:
-                report['top_departments'].append({
-                    'department': row[0],
-                    'total_hours': float(row[1]),
-                    'total_cost': float(row[2]),
-                    'avg_projects': float(row[3])
-                })
+            dept_stats = dept.groupby('department_name').agg(
+                total_hours=('total_hours', 'sum'),
+                total_cost=('total_labor_cost', 'sum'),
+                avg_projects=('num_projects', 'mean')
+            ).sort_values('total_hours', ascending=False).head(10)
+            
+            report['top_departments'] = [
+                {
+                    'department': department,
+                    'total_hours': float(total_hours),
+                    'total_cost': float(total_cost),
+                    'avg_projects': float(avg_projects)
+                }
+                for department, total_hours, total_cost, avg_projects in zip(
+                    dept_stats.index, dept_stats['total_hours'],
+                    dept_stats['total_cost'], dept_stats['avg_projects']
+                )
+            ]
             
             # Generate alerts
-            # Alert 1: Loss-making projects
-            loss_query = """
-                SELECT COUNT(*) as count, SUM(profit) as total_loss
-                FROM financial_summary
-                WHERE report_date BETWEEN %s AND %s AND profit < 0
-            """
-            
-            self.cursor.execute(loss_query, (start_date, end_date))
-            loss_result = self.cursor.fetchone()
+            # Both alert aggregates in one pass, like SUM(CASE WHEN ...)
+            profit = fin['profit'].to_numpy()
+            loss_mask = profit < 0
+            loss_count = int(np.count_nonzero(loss_mask))
+            total_loss = float(profit.sum(where=loss_mask))
+            low_eff_count = int(np.count_nonzero(
+                (fin['efficiency_score'].to_numpy() < 100) & (fin['total_hours'].to_numpy() > 0)
+            ))
             
-            if loss_result and loss_result[0] > 0:
+            # Alert 1: Loss-making projects
+            if loss_count > 0:
                 report['alerts'].append({
                     'type': 'loss_making_projects',
                     'severity': 'high',
-                    'message': f"{loss_result[0]} projects with total loss of ¥{abs(loss_result[1]):,.2f}"
+                    'message': f"{loss_count} projects with total loss of ¥{abs(total_loss):,.2f}"
                 })
             
             # Alert 2: Low efficiency
-            low_eff_query = """
-                SELECT COUNT(*) as count
-                FROM financial_summary
-                WHERE report_date BETWEEN %s AND %s 
-                    AND efficiency_score < 100 
-                    AND total_hours > 0
-            """
-            
-            self.cursor.execute(low_eff_query, (start_date, end_date))
-            eff_result = self.cursor.fetchone()
-            
-            if eff_result and eff_result[0] > 0:
+            if low_eff_count > 0:
                 report['alerts'].append({
                     'type': 'low_efficiency',
                     'severity': 'medium',
-                    'message': f"{eff_result[0]} projects with low efficiency scores"
+                    'message': f"{low_eff_count} projects with low efficiency scores"
                 })
             
             return report
@@ -388,34 +643,30 @@ class AutomatedReportGenerator:
         """Generate daily summary report"""
         report = self.db.generate_automated_report()
         
-        # Format report
-        lines = []
-        lines.append("=" * 60)
-        lines.append("WTL DAILY FINANCIAL REPORT")
-        lines.append("=" * 60)
-        lines.append(f"Generated: {report['generated_at']}")
-        lines.append(f"Period: {report['report_period']}")
-        lines.append("")
-        
-        # Summary
+        # Header and summary
         summary = report['summary']
-        lines.append("SUMMARY")
-        lines.append("-" * 30)
-        lines.append(f"Total Projects: {summary['total_projects']}")
-        lines.append(f"Total Revenue: ¥{summary['total_revenue']:,.2f}")
-        lines.append(f"Total Profit: ¥{summary['total_profit']:,.2f}")
-        lines.append(f"Avg Profit Margin: {summary['avg_profit_margin']:.2f}%")
-        lines.append("")
+        body = f"""{"=" * 60}
+WTL DAILY FINANCIAL REPORT
+{"=" * 60}
+Generated: {report['generated_at']}
+Period: {report['report_period']}
+
+SUMMARY
+{"-" * 30}
+Total Projects: {summary['total_projects']}
+Total Revenue: ¥{summary['total_revenue']:,.2f}
+Total Profit: ¥{summary['total_profit']:,.2f}
+Avg Profit Margin: {summary['avg_profit_margin']:.2f}%
+"""
         
         # Alerts
-        if report['alerts']:
-            lines.append("ALERTS")
-            lines.append("-" * 30)
-            for alert in report['alerts']:
-                lines.append(f"[{alert['severity'].upper()}] {alert['message']}")
-            lines.append("")
+        if not report['alerts']:
+            return body
         
-        return '\n'.join(lines)
+        alert_lines = '\n'.join(
+            f"[{alert['severity'].upper()}] {alert['message']}" for alert in report['alerts']
+        )
+        return f"{body}\nALERTS\n{'-' * 30}\n{alert_lines}\n"
 
 
 def main():
@@ -426,7 +677,8 @@ def main():
         # Setup database
         db.create_database()
         db.connect()
-        db.create_tables()
+        db.ensure_schema()
+        db.ensure_month_partition(datetime.now().strftime('%Y-%m-%d'))
         
         # Test with sample data
         from data_loader import DataLoader
@@ -441,8 +693,9 @@ def main():
         financial_summary = processor.calculate_all_metrics()
         
         # Insert data
-        db.insert_financial_summary(financial_summary)
-        db.insert_department_summary(processor.department_summary_df)
+        with db.transaction():
+            db.insert_financial_summary(financial_summary)
+            db.insert_department_summary(processor.department_summary_df)
         
         # Generate automated report
         report = db.generate_automated_report()
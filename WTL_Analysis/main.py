@@ -1,13 +1,15 @@
 import os
 import sys
+import hashlib
 import logging
 from datetime import datetime
 import argparse
+import pandas as pd
 
 # Import all modules
 from config import *
 from data_loader import DataLoader
-from data_processor import DataProcessor
+from data_processor import DataProcessor, LazyAnalyses
 from Visualization import Visualizer
 from report_generator import ReportGenerator
 from database_manager import DatabaseManager, AutomatedReportGenerator
@@ -19,13 +21,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bump when DataProcessor or the cached frame layout changes so caches
+# written by older code are ignored
+CACHE_VERSION = 1
+
+# Settings the loader and processor read; editing any of them invalidates the cache
+CACHED_CONFIG = {
+    'sheets': SHEETS,
+    'work_hours_columns': WORK_HOURS_COLUMNS,
+    'gs_project_columns': GS_PROJECT_COLUMNS,
+    'iss_project_columns': ISS_PROJECT_COLUMNS,
+    'gs_color_coding': GS_COLOR_CODING,
+    'color_status_map': COLOR_STATUS_MAP,
+    'department_salaries': DEPARTMENT_SALARIES,
+    'work_hours_per_year': WORK_HOURS_PER_YEAR
+}
+
 
 class WTLAnalysisSystem:
     """Main system orchestrator"""
     
-    def __init__(self, excel_path: str = EXCEL_FILE_PATH, use_database: bool = False):
+    def __init__(self, excel_path: str = EXCEL_FILE_PATH, use_database: bool = False,
+                 report_only: bool = False, quiet: bool = False, bootstrap: bool = False):
         self.excel_path = excel_path
-        self.use_database = use_database
+        self.use_database = use_database or bootstrap
+        self.bootstrap = bootstrap
+        self.report_only = report_only
+        self.quiet = quiet
         self.data_loader = None
         self.data_processor = None
         self.visualizer = None
@@ -37,20 +59,27 @@ class WTLAnalysisSystem:
         self.projects_df = None
         self.financial_summary_df = None
         self.department_summary_df = None
+        # Built on the first custom report, see _index_summary
+        self._by_type = None
+        self._by_status = None
         
     def run_complete_analysis(self):
         """Run complete financial analysis pipeline"""
         logger.info("Starting WTL Financial Analysis System...")
         
         try:
-            # Step 1: Load data
-            self._load_data()
-            
-            # Step 2: Process data
-            self._process_data()
+            # Steps 1-2: Load and process data, unless cached for this Excel file
+            cache_paths = self._cache_paths()
+            if not self._load_cached_results(cache_paths):
+                self._load_data()
+                self._process_data()
+                self._save_cached_results(cache_paths)
+            # A fresh summary invalidates any custom-report index
+            self._by_type = self._by_status = None
             
             # Step 3: Generate visualizations
-            self._create_visualizations()
+            if not self.report_only:
+                self._create_visualizations()
             
             # Step 4: Generate reports
             self._generate_reports()
@@ -60,7 +89,8 @@ class WTLAnalysisSystem:
                 self._database_operations()
             
             logger.info("Analysis completed successfully!")
-            self._print_summary()
+            if not self.quiet:
+                self._print_summary()
             
         except Exception as e:
             logger.error(f"Error during analysis: {e}")
@@ -86,14 +116,69 @@ class WTLAnalysisSystem:
         self.data_processor = DataProcessor(self.work_hours_df, self.projects_df)
         self.financial_summary_df = self.data_processor.calculate_all_metrics()
         self.department_summary_df = self.data_processor.department_summary_df
+        self._compute_analyses()
+        
+        logger.info("Data processing completed")
+    
+    def _compute_analyses(self):
+        """Derive the efficiency and profitability analyses"""
+        # Each analysis is only computed once a report asks for it
+        self.analyses = LazyAnalyses({
+            'efficiency': self.data_processor.get_efficiency_analysis,
+            'profitability': self.data_processor.get_profitability_analysis
+        })
+    
+    def _index_summary(self):
+        """Split the summary by project type and status for custom reports"""
+        summary = self.financial_summary_df.astype({
+            'ProjectType': 'category',
+            'Status': 'category'
+        })
+        self._by_type = dict(list(summary.groupby('ProjectType', observed=True)))
+        self._by_status = dict(list(summary.groupby('Status', observed=True)))
+    
+    def _cache_paths(self) -> dict:
+        """Parquet cache files keyed by the Excel contents, processing config and cache version"""
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(self.excel_path, 'rb') as f:
+            hasher.update(f.read())
+        hasher.update(repr((CACHE_VERSION, CACHED_CONFIG)).encode())
+        key = hasher.hexdigest()
         
-        # Get analyses
-        self.analyses = {
-            'efficiency': self.data_processor.get_efficiency_analysis(),
-            'profitability': self.data_processor.get_profitability_analysis()
+        return {
+            name: os.path.join(REPORT_CONFIG['cache_dir'], f"{key}_{name}.parquet")
+            for name in ('summary', 'department', 'work_hours')
         }
+    
+    def _load_cached_results(self, cache_paths: dict) -> bool:
+        """Load processed results cached by a previous run on the same Excel file"""
+        if not all(os.path.exists(path) for path in cache_paths.values()):
+            return False
         
-        logger.info("Data processing completed")
+        logger.info("Excel file unchanged, loading cached results...")
+        self.financial_summary_df = pd.read_parquet(cache_paths['summary'])
+        self.department_summary_df = pd.read_parquet(cache_paths['department'])
+        self.work_hours_df = pd.read_parquet(cache_paths['work_hours'])
+        
+        self.data_processor = DataProcessor(self.work_hours_df, self.projects_df)
+        self.data_processor.financial_summary_df = self.financial_summary_df
+        self.data_processor.department_summary_df = self.department_summary_df
+        self._compute_analyses()
+        
+        logger.info(f"Loaded {len(self.financial_summary_df)} projects from cache")
+        return True
+    
+    def _save_cached_results(self, cache_paths: dict):
+        """Cache processed results as Parquet for the next run"""
+        os.makedirs(REPORT_CONFIG['cache_dir'], exist_ok=True)
+        
+        try:
+            self.financial_summary_df.to_parquet(cache_paths['summary'], compression='zstd')
+            self.department_summary_df.to_parquet(cache_paths['department'], compression='zstd')
+            self.work_hours_df.to_parquet(cache_paths['work_hours'], compression='zstd')
+        except (ImportError, ValueError, TypeError) as e:
+            # Parquet needs pyarrow or fastparquet; run without the cache otherwise
+            logger.warning(f"Could not cache processed results: {e}")
     
     def _create_visualizations(self):
         """Create all visualizations"""
@@ -128,21 +213,24 @@ class WTLAnalysisSystem:
         self.db_manager = DatabaseManager()
         
         try:
-            # Setup database
-            self.db_manager.create_database()
+            # Setup database; creating it is a one-off --bootstrap step
+            if self.bootstrap:
+                self.db_manager.create_database()
             self.db_manager.connect()
-            self.db_manager.create_tables()
+            self.db_manager.ensure_schema()
             
-            # Insert data
+            # Insert data in a single transaction
             report_date = datetime.now().strftime('%Y-%m-%d')
-            self.db_manager.insert_financial_summary(
-                self.financial_summary_df, 
-                report_date
-            )
-            self.db_manager.insert_department_summary(
-                self.department_summary_df, 
-                report_date
-            )
+            self.db_manager.ensure_month_partition(report_date)
+            with self.db_manager.transaction():
+                self.db_manager.insert_financial_summary(
+                    self.financial_summary_df, 
+                    report_date
+                )
+                self.db_manager.insert_department_summary(
+                    self.department_summary_df, 
+                    report_date
+                )
             
             # Generate automated report
             auto_gen = AutomatedReportGenerator(self.db_manager)
@@ -173,7 +261,8 @@ class WTLAnalysisSystem:
         
         # File outputs
         print("\nGenerated Files:")
-        print(f"  Visualizations: {REPORT_CONFIG['visualizations_dir']}/")
+        if not self.report_only:
+            print(f"  Visualizations: {REPORT_CONFIG['visualizations_dir']}/")
         print(f"  Reports: {REPORT_CONFIG['output_dir']}/")
         
         if self.use_database:
@@ -185,11 +274,15 @@ class WTLAnalysisSystem:
     
     def generate_custom_report(self, report_type: str, **kwargs):
         """Generate custom report based on specific criteria"""
-        if not self.financial_summary_df is not None:
+        if self.financial_summary_df is None:
             raise ValueError("Must run analysis first")
         
         logger.info(f"Generating custom report: {report_type}")
         
+        # Split once and reuse for later custom reports on the same summary
+        if report_type in ('project_type', 'status') and self._by_type is None:
+            self._index_summary()
+        
         if report_type == 'department':
             # Filter by department
             dept = kwargs.get('department')
@@ -201,18 +294,14 @@ class WTLAnalysisSystem:
             # Filter by project type
             ptype = kwargs.get('project_type')
             if ptype:
-                filtered_data = self.financial_summary_df[
-                    self.financial_summary_df['ProjectType'] == ptype
-                ]
+                filtered_data = self._by_type.get(ptype, self.financial_summary_df.iloc[:0])
                 # Generate report for filtered data
         
         elif report_type == 'status':
             # Filter by status
             status = kwargs.get('status')
             if status:
-                filtered_data = self.financial_summary_df[
-                    self.financial_summary_df['Status'] == status
-                ]
+                filtered_data = self._by_status.get(status, self.financial_summary_df.iloc[:0])
                 # Generate report for filtered data
         
         logger.info(f"Custom report {report_type} generated")
@@ -237,13 +326,26 @@ def main():
         action='store_true',
         help='Generate reports only (skip visualizations)'
     )
+    parser.add_argument(
+        '--quiet', 
+        action='store_true',
+        help='Skip printing the analysis summary'
+    )
+    parser.add_argument(
+        '--bootstrap', 
+        action='store_true',
+        help='Create the database before storing results (implies --use-db)'
+    )
     
     args = parser.parse_args()
     
     # Create system instance
     system = WTLAnalysisSystem(
         excel_path=args.excel,
-        use_database=args.use_db
+        use_database=args.use_db,
+        report_only=args.report_only,
+        quiet=args.quiet,
+        bootstrap=args.bootstrap
     )
     
     # Run analysis
@@ -3,13 +3,39 @@ import numpy as np
 from datetime import datetime
 import os
 import json
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Iterable, Iterator
 import logging
 from config import REPORT_CONFIG, DEPARTMENT_SALARIES
+from data_processor import select_extreme
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson is optional; fall back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Section rules shared by every text report
+_EQ80 = "=" * 80
+_EQ40 = "=" * 40
+_DASH40 = "-" * 40
+_DASH30 = "-" * 30
+
+
+def _rank_order(values: np.ndarray, descending: bool = False) -> np.ndarray:
+    """Argsort in the same order as sort_values, including NaN and tie placement"""
+    positions = np.flatnonzero(~np.isnan(values))
+    present = values[positions]
+    if descending:
+        # sort_values sorts the reversed values ascending and reverses the result
+        order = positions[::-1][np.argsort(present[::-1])][::-1]
+    else:
+        order = positions[np.argsort(present)]
+    return np.concatenate([order, np.flatnonzero(np.isnan(values))])
+
 
 class ReportGenerator:
     """Generate comprehensive reports"""
@@ -17,55 +43,101 @@ class ReportGenerator:
     def __init__(self, financial_summary_df: pd.DataFrame,
                  department_summary_df: pd.DataFrame,
                  processor_analyses: Dict[str, Any]):
-        self.financial_summary = financial_summary_df
-        self.department_summary = department_summary_df
+        # Categorical keys turn the equality masks and groupings below into
+        # integer compares; astype copies, leaving the caller's frame as is
+        self.financial_summary = financial_summary_df.astype({
+            col: 'category' for col in ('ProjectType', 'Status')
+            if col in financial_summary_df.columns
+            and not isinstance(financial_summary_df[col].dtype, pd.CategoricalDtype)
+        })
+        # Project counts are printed as floats, as in earlier reports
+        self.department_summary = department_summary_df.astype({
+            col: float for col in ('NumProjects',) if col in department_summary_df.columns
+        })
         self.analyses = processor_analyses
         
+        # Subsets and groupings shared by several reports
+        self._gs_mask = self.financial_summary['ProjectType'].values == 'GS'
+        self._gs_projects = self.financial_summary.loc[self._gs_mask]
+        self._loss_mask = self.financial_summary['Profit'].values < 0
+        self._type_group = self.financial_summary.groupby('ProjectType', observed=True)
+        self._status_totals = self._summarize_statuses()
+        
         # Create output directory
         self.output_dir = REPORT_CONFIG['output_dir']
         os.makedirs(self.output_dir, exist_ok=True)
         
+        self._set_generation_time()
+        
     def generate_all_reports(self):
         """Generate all report types"""
         logger.info("Generating reports...")
         
-        # Text report
-        self.generate_text_report()
-        
-        # Executive summary
-        self.generate_executive_summary()
-        
-        # Department report
-        self.generate_department_report()
+        # One timestamp for the whole run so the reports agree
+        self._set_generation_time()
         
-        # Project status report
-        self.generate_status_report()
+        generators = [
+            self.generate_text_report,
+            self.generate_executive_summary,
+            self.generate_department_report,
+            self.generate_status_report,
+            self.generate_recommendations
+        ]
         
-        # Recommendations report
-        self.generate_recommendations()
+        # Generators only read the cached summaries and each writes its own
+        # file, so they can run concurrently
+        with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+            futures = [executor.submit(generator) for generator in generators]
+            for future in futures:
+                future.result()
         
         logger.info(f"All reports saved to {self.output_dir}")
     
+    def _summarize_statuses(self) -> pd.DataFrame:
+        """Per-status GS totals shared by the text, status and summary reports"""
+        grouped = self._gs_projects.groupby('Status', observed=True)
+        totals = grouped.agg(
+            Projects=('ProjectCode', 'count'),
+            Revenue=('ContractPrice', 'sum'),
+            Profit=('Profit', 'sum'),
+            Hours=('TotalHours', 'sum'),
+            AvgProfit=('Profit', 'mean'),
+            AvgMargin=('ProfitMargin', 'mean')
+        )
+        totals.insert(0, 'Rows', grouped.size())
+        return totals
+    
+    def _set_generation_time(self):
+        """Stamp the reports generated from now on with the current time"""
+        self._gen_ts = datetime.now()
+        self._gen_ts_str = self._gen_ts.strftime('%Y-%m-%d %H:%M:%S')
+        self._gen_ts_iso = self._gen_ts.isoformat()
+    
     def generate_text_report(self):
         """Generate comprehensive text report"""
-        report_lines = []
+        output_path = os.path.join(self.output_dir, 'q3_financial_report.txt')
+        self._write_lines(output_path, self._text_report_lines())
         
+        logger.info(f"Text report saved to {output_path}")
+    
+    def _text_report_lines(self) -> Iterator[str]:
+        """Yield the lines of the comprehensive text report"""
         # Header
-        report_lines.extend([
-            "=" * 80,
+        yield from [
+            _EQ80,
             "WTL DESIGN Q3 20X2 FINANCIAL ANALYSIS REPORT",
-            "=" * 80,
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            _EQ80,
+            f"Generated: {self._gen_ts_str}",
             "",
-            "=" * 80,
+            _EQ80,
             "EXECUTIVE SUMMARY",
-            "=" * 80,
+            _EQ80,
             ""
-        ])
+        ]
         
         # Overall metrics
         overall = self.analyses['profitability']['overall_metrics']
-        report_lines.extend([
+        yield from [
             f"Total Revenue: ¥{overall['total_revenue']:,.2f}",
             f"Total Cost: ¥{overall['total_cost']:,.2f}",
             f"Total Profit: ¥{overall['total_profit']:,.2f}",
@@ -75,46 +147,55 @@ class ReportGenerator:
             f"  - Loss-making: {overall['loss_making_projects_count']}",
             f"  - Break-even: {overall['break_even_projects_count']}",
             "",
-            "=" * 80,
+            _EQ80,
             "PROJECT PERFORMANCE ANALYSIS",
-            "=" * 80,
+            _EQ80,
             ""
-        ])
+        ]
         
         # Top performing projects
-        report_lines.append("TOP 10 PROFITABLE PROJECTS:")
-        report_lines.append("-" * 40)
-        top_projects = self.financial_summary.nlargest(10, 'Profit')
-        for _, project in top_projects.iterrows():
-            report_lines.append(
-                f"{project['ProjectCode']}: ¥{project['Profit']:,.2f} "
-                f"(Margin: {project['ProfitMargin']:.1f}%, "
-                f"Hours: {project['TotalHours']:,.0f})"
+        yield "TOP 10 PROFITABLE PROJECTS:"
+        yield _DASH40
+        top_projects = select_extreme(self.financial_summary, 'Profit', 10)
+        yield from (
+            f"{code}: ¥{profit:,.2f} "
+            f"(Margin: {margin:.1f}%, "
+            f"Hours: {hours:,.0f})"
+            for code, profit, margin, hours in zip(
+                top_projects['ProjectCode'].to_numpy(),
+                top_projects['Profit'].to_numpy(),
+                top_projects['ProfitMargin'].to_numpy(),
+                top_projects['TotalHours'].to_numpy()
             )
+        )
         
         # Loss-making projects
-        report_lines.extend(["", "SIGNIFICANT LOSS-MAKING PROJECTS:", "-" * 40])
+        yield from ["", "SIGNIFICANT LOSS-MAKING PROJECTS:", _DASH40]
         loss_projects = self.analyses['profitability']['loss_making_projects'].head(10)
         if not loss_projects.empty:
-            for _, project in loss_projects.iterrows():
-                report_lines.append(
-                    f"{project['ProjectCode']}: ¥{project['Profit']:,.2f} "
-                    f"(Margin: {project['ProfitMargin']:.1f}%)"
+            yield from (
+                f"{code}: ¥{profit:,.2f} "
+                f"(Margin: {margin:.1f}%)"
+                for code, profit, margin in zip(
+                    loss_projects['ProjectCode'].to_numpy(),
+                    loss_projects['Profit'].to_numpy(),
+                    loss_projects['ProfitMargin'].to_numpy()
                 )
+            )
         else:
-            report_lines.append("No significant loss-making projects found.")
+            yield "No significant loss-making projects found."
         
         # Efficiency analysis
-        report_lines.extend([
+        yield from [
             "",
-            "=" * 80,
+            _EQ80,
             "EFFICIENCY ANALYSIS",
-            "=" * 80,
+            _EQ80,
             ""
-        ])
+        ]
         
         eff_dist = self.analyses['efficiency']['efficiency_distribution']
-        report_lines.extend([
+        yield from [
             f"Average Efficiency Score: {eff_dist['mean']:.2f}",
             f"Median Efficiency Score: {eff_dist['median']:.2f}",
             f"Standard Deviation: {eff_dist['std']:.2f}",
@@ -125,91 +206,96 @@ class ReportGenerator:
             f"  75th: {eff_dist['percentiles']['75%']:.2f}",
             f"  90th: {eff_dist['percentiles']['90%']:.2f}",
             ""
-        ])
+        ]
         
         # Department analysis
-        report_lines.extend([
-            "=" * 80,
+        yield from [
+            _EQ80,
             "DEPARTMENT ANALYSIS",
-            "=" * 80,
+            _EQ80,
             ""
-        ])
+        ]
         
         dept_sorted = self.department_summary.sort_values('TotalLaborCost', ascending=False)
-        for dept, row in dept_sorted.iterrows():
-            report_lines.extend([
+        for dept, hours, labor_cost, num_projects, hours_per_project, rate in zip(
+            dept_sorted.index,
+            dept_sorted['TotalHours'].to_numpy(),
+            dept_sorted['TotalLaborCost'].to_numpy(),
+            dept_sorted['NumProjects'].to_numpy(),
+            dept_sorted['HoursPerProject'].to_numpy(),
+            dept_sorted['HourlyRate'].to_numpy()
+        ):
+            yield from [
                 f"{dept}:",
-                f"  Total Hours: {row['TotalHours']:,.0f}",
-                f"  Total Labor Cost: ¥{row['TotalLaborCost']:,.2f}",
-                f"  Projects Involved: {row['NumProjects']}",
-                f"  Average Hours per Project: {row['HoursPerProject']:.1f}",
-                f"  Hourly Rate: ¥{row['HourlyRate']:.2f}",
+                f"  Total Hours: {hours:,.0f}",
+                f"  Total Labor Cost: ¥{labor_cost:,.2f}",
+                f"  Projects Involved: {num_projects}",
+                f"  Average Hours per Project: {hours_per_project:.1f}",
+                f"  Hourly Rate: ¥{rate:.2f}",
                 ""
-            ])
+            ]
         
         # Project type comparison
-        report_lines.extend([
-            "=" * 80,
+        yield from [
+            _EQ80,
             "PROJECT TYPE COMPARISON",
-            "=" * 80,
+            _EQ80,
             ""
-        ])
-        
-        type_summary = self.financial_summary.groupby('ProjectType').agg({
-            'ProjectCode': 'count',
-            'ContractPrice': 'sum',
-            'Profit': 'sum',
-            'ProfitMargin': 'mean',
-            'EfficiencyScore': 'mean'
-        }).rename(columns={'ProjectCode': 'Count'})
-        
-        for ptype, row in type_summary.iterrows():
-            report_lines.extend([
+        ]
+        
+        # Cast so the counts print like the department project counts
+        type_totals = self._type_group.agg(
+            Count=('ProjectCode', 'count'),
+            Revenue=('ContractPrice', 'sum'),
+            Profit=('Profit', 'sum'),
+            Margin=('ProfitMargin', 'mean'),
+            Efficiency=('EfficiencyScore', 'mean')
+        ).astype(float)
+        
+        for ptype, count, revenue, profit, margin, efficiency in (
+            type_totals.itertuples(name=None)
+        ):
+            yield from [
                 f"{ptype} Projects:",
-                f"  Count: {row['Count']}",
-                f"  Total Revenue: ¥{row['ContractPrice']:,.2f}",
-                f"  Total Profit: ¥{row['Profit']:,.2f}",
-                f"  Average Profit Margin: {row['ProfitMargin']:.2f}%",
-                f"  Average Efficiency: {row['EfficiencyScore']:.2f}",
+                f"  Count: {count}",
+                f"  Total Revenue: ¥{revenue:,.2f}",
+                f"  Total Profit: ¥{profit:,.2f}",
+                f"  Average Profit Margin: {margin:.2f}%",
+                f"  Average Efficiency: {efficiency:.2f}",
                 ""
-            ])
+            ]
         
         # Status analysis (GS projects only)
-        gs_projects = self.financial_summary[self.financial_summary['ProjectType'] == 'GS']
-        if not gs_projects.empty:
-            report_lines.extend([
-                "=" * 80,
+        if not self._gs_projects.empty:
+            yield from [
+                _EQ80,
                 "GS PROJECT STATUS ANALYSIS",
-                "=" * 80,
+                _EQ80,
                 ""
-            ])
-            
-            status_summary = gs_projects.groupby('Status').agg({
-                'ProjectCode': 'count',
-                'Profit': ['sum', 'mean'],
-                'ProfitMargin': 'mean'
-            })
+            ]
             
-            for status in status_summary.index:
-                count = status_summary.loc[status, ('ProjectCode', 'count')]
-                total_profit = status_summary.loc[status, ('Profit', 'sum')]
-                avg_profit = status_summary.loc[status, ('Profit', 'mean')]
-                avg_margin = status_summary.loc[status, ('ProfitMargin', 'mean')]
-                
-                report_lines.extend([
+            totals = self._status_totals
+            for status, count, total_profit, avg_profit, avg_margin in zip(
+                totals.index,
+                totals['Projects'].to_numpy(),
+                totals['Profit'].to_numpy(),
+                totals['AvgProfit'].to_numpy(),
+                totals['AvgMargin'].to_numpy()
+            ):
+                yield from [
                     f"{status}:",
                     f"  Projects: {count}",
                     f"  Total Profit: ¥{total_profit:,.2f}",
                     f"  Average Profit: ¥{avg_profit:,.2f}",
                     f"  Average Margin: {avg_margin:.2f}%",
                     ""
-                ])
+                ]
         
         # Limitations
-        report_lines.extend([
-            "=" * 80,
+        yield from [
+            _EQ80,
             "LIMITATIONS AND ASSUMPTIONS",
-            "=" * 80,
+            _EQ80,
             "",
             "1. Data Quality:",
             "   - Some project codes in work hours may not match project records",
@@ -227,20 +313,13 @@ class ReportGenerator:
             "   - Some projects may be ongoing with incomplete costs",
             "   - Seasonal variations not captured",
             "",
-            "=" * 80
-        ])
-        
-        # Save report
-        output_path = os.path.join(self.output_dir, 'q3_financial_report.txt')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report_lines))
-        
-        logger.info(f"Text report saved to {output_path}")
+            _EQ80
+        ]
         
     def generate_executive_summary(self):
         """Generate executive summary"""
         summary = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': self._gen_ts_iso,
             'overview': self.analyses['profitability']['overall_metrics'],
             'key_findings': {
                 'top_performer': self._get_top_performer(),
@@ -265,262 +344,279 @@ class ReportGenerator:
         
         # Save as JSON
         output_path = os.path.join(self.output_dir, 'executive_summary.json')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Same layout as json.dump(indent=2, ensure_ascii=False), in C
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    summary,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Executive summary saved to {output_path}")
     
     def generate_department_report(self):
         """Generate detailed department report"""
-        report_lines = []
+        output_path = os.path.join(self.output_dir, 'department_report.txt')
+        self._write_lines(output_path, self._department_report_lines())
         
-        report_lines.extend([
-            "=" * 80,
+        logger.info(f"Department report saved to {output_path}")
+    
+    def _department_report_lines(self) -> Iterator[str]:
+        """Yield the lines of the detailed department report"""
+        yield from [
+            _EQ80,
             "DEPARTMENT PERFORMANCE REPORT",
-            "=" * 80,
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            _EQ80,
+            f"Generated: {self._gen_ts_str}",
             "",
-        ])
+        ]
+        
+        # Department rankings; each is one argsort over the same arrays
+        ds = self.department_summary
+        depts = ds.index.to_numpy()
+        hours = ds['TotalHours'].to_numpy(dtype=float)
+        num_projects = ds['NumProjects'].to_numpy()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cost_per_hour = ds['TotalLaborCost'].to_numpy(dtype=float) / hours
         
-        # Department rankings
-        report_lines.extend([
+        yield from [
             "DEPARTMENT RANKINGS",
-            "=" * 40,
+            _EQ40,
             "",
             "By Total Hours Worked:",
-            "-" * 30
-        ])
+            _DASH30
+        ]
         
-        hours_ranking = self.department_summary.sort_values('TotalHours', ascending=False)
-        for i, (dept, row) in enumerate(hours_ranking.iterrows(), 1):
-            report_lines.append(f"{i}. {dept}: {row['TotalHours']:,.0f} hours")
+        order = _rank_order(hours, descending=True)
+        for i, (dept, dept_hours) in enumerate(zip(depts[order], hours[order]), 1):
+            yield f"{i}. {dept}: {dept_hours:,.0f} hours"
         
-        report_lines.extend([
+        yield from [
             "",
             "By Number of Projects:",
-            "-" * 30
-        ])
+            _DASH30
+        ]
         
-        project_ranking = self.department_summary.sort_values('NumProjects', ascending=False)
-        for i, (dept, row) in enumerate(project_ranking.iterrows(), 1):
-            report_lines.append(f"{i}. {dept}: {row['NumProjects']} projects")
+        order = _rank_order(num_projects, descending=True)
+        for i, (dept, count) in enumerate(zip(depts[order], num_projects[order]), 1):
+            yield f"{i}. {dept}: {count} projects"
         
-        report_lines.extend([
+        yield from [
             "",
             "By Labor Cost Efficiency (Cost per Hour):",
-            "-" * 30
-        ])
+            _DASH30
+        ]
         
-        cost_efficiency = (self.department_summary['TotalLaborCost'] / 
-                          self.department_summary['TotalHours']).sort_values()
-        for i, (dept, efficiency) in enumerate(cost_efficiency.items(), 1):
-            report_lines.append(f"{i}. {dept}: ¥{efficiency:.2f}/hour")
+        order = _rank_order(cost_per_hour)
+        for i, (dept, efficiency) in enumerate(zip(depts[order], cost_per_hour[order]), 1):
+            yield f"{i}. {dept}: ¥{efficiency:.2f}/hour"
         
         # Department collaboration matrix
-        report_lines.extend([
+        yield from [
             "",
-            "=" * 80,
+            _EQ80,
             "DEPARTMENT COLLABORATION ANALYSIS",
-            "=" * 80,
+            _EQ80,
             ""
-        ])
+        ]
         
         # This would require access to work_hours data for full implementation
-        report_lines.append("(Department collaboration matrix requires detailed analysis)")
-        
-        # Save report
-        output_path = os.path.join(self.output_dir, 'department_report.txt')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report_lines))
-        
-        logger.info(f"Department report saved to {output_path}")
+        yield "(Department collaboration matrix requires detailed analysis)"
     
     def generate_status_report(self):
         """Generate project status report for GS projects"""
-        gs_projects = self.financial_summary[self.financial_summary['ProjectType'] == 'GS']
-        
-        if gs_projects.empty:
+        if self._gs_projects.empty:
             logger.warning("No GS projects found for status report")
             return
+        output_path = os.path.join(self.output_dir, 'gs_status_report.txt')
+        self._write_lines(output_path, self._status_report_lines())
+        
+        logger.info(f"Status report saved to {output_path}")
+    
+    def _status_report_lines(self) -> Iterator[str]:
+        """Yield the lines of the GS project status report"""
+        # One pass splits the GS projects by status
+        groups = dict(list(self._gs_projects.groupby('Status', sort=False, observed=True)))
         
-        report_lines = []
-        report_lines.extend([
-            "=" * 80,
+        yield from [
+            _EQ80,
             "GS PROJECT STATUS REPORT",
-            "=" * 80,
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            _EQ80,
+            f"Generated: {self._gen_ts_str}",
             "",
-        ])
+        ]
         
         # Status breakdown
         for status in ['Success', 'Negotiation', 'In Progress', 'Fail', 'Unknown']:
-            status_projects = gs_projects[gs_projects['Status'] == status]
-            
-            if not status_projects.empty:
-                report_lines.extend([
-                    f"{status.upper()} PROJECTS ({len(status_projects)} projects)",
-                    "=" * 40,
+            status_projects = groups.get(status)
+            if status_projects is not None:
+                totals = self._status_totals.loc[status]
+                yield from [
+                    f"{status.upper()} PROJECTS ({int(totals['Rows'])} projects)",
+                    _EQ40,
                     ""
-                ])
+                ]
                 
                 # Summary metrics
-                report_lines.extend([
-                    f"Total Revenue: ¥{status_projects['ContractPrice'].sum():,.2f}",
-                    f"Total Profit: ¥{status_projects['Profit'].sum():,.2f}",
-                    f"Average Profit Margin: {status_projects['ProfitMargin'].mean():.2f}%",
-                    f"Total Hours: {status_projects['TotalHours'].sum():,.0f}",
+                yield from [
+                    f"Total Revenue: ¥{totals['Revenue']:,.2f}",
+                    f"Total Profit: ¥{totals['Profit']:,.2f}",
+                    f"Average Profit Margin: {totals['AvgMargin']:.2f}%",
+                    f"Total Hours: {totals['Hours']:,.0f}",
                     ""
-                ])
+                ]
                 
-                # List projects
-                report_lines.append("Projects:")
-                for _, project in status_projects.iterrows():
-                    report_lines.append(
-                        f"  - {project['ProjectCode']}: {project['ProjectName'][:50]}..."
-                        if len(project['ProjectName']) > 50 else 
-                        f"  - {project['ProjectCode']}: {project['ProjectName']}"
+                # List projects, truncating long names
+                names = status_projects['ProjectName'].astype(str)
+                names = names.where(names.str.len() <= 50, names.str.slice(0, 50) + '...')
+                yield "Projects:"
+                yield from (
+                    f"  - {code}: {name}"
+                    for code, name in zip(
+                        status_projects['ProjectCode'].to_numpy(),
+                        names.to_numpy()
                     )
-                report_lines.append("")
-        
-        # Save report
-        output_path = os.path.join(self.output_dir, 'gs_status_report.txt')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report_lines))
-        
-        logger.info(f"Status report saved to {output_path}")
+                )
+                yield ""
     
     def generate_recommendations(self):
         """Generate recommendations based on analysis"""
-        recommendations = []
+        output_path = os.path.join(self.output_dir, 'strategic_recommendations.txt')
+        self._write_lines(output_path, self._recommendation_lines())
         
-        recommendations.extend([
-            "=" * 80,
+        logger.info(f"Recommendations saved to {output_path}")
+    
+    def _recommendation_lines(self) -> Iterator[str]:
+        """Yield the lines of the strategic recommendations"""
+        yield from [
+            _EQ80,
             "STRATEGIC RECOMMENDATIONS",
-            "=" * 80,
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            _EQ80,
+            f"Generated: {self._gen_ts_str}",
             "",
             "Based on Q3 20X2 financial analysis, the following recommendations are proposed:",
             ""
-        ])
+        ]
         
         # 1. Project Management Recommendations
-        recommendations.extend([
+        yield from [
             "1. PROJECT MANAGEMENT",
-            "-" * 40,
-        ])
+            _DASH40,
+        ]
         
         # Check for loss-making projects
-        loss_count = len(self.financial_summary[self.financial_summary['Profit'] < 0])
+        loss_count = int(np.count_nonzero(self._loss_mask))
         if loss_count > 0:
-            recommendations.append(
+            yield (
                 f"   • Review {loss_count} loss-making projects for cost optimization"
             )
         
         # Check efficiency variance
         eff_std = self.analyses['efficiency']['efficiency_distribution']['std']
         if eff_std > 100:
-            recommendations.append(
+            yield (
                 "   • Standardize project management practices to reduce efficiency variance"
             )
         
         # Status-based recommendations
-        gs_projects = self.financial_summary[self.financial_summary['ProjectType'] == 'GS']
-        if not gs_projects.empty:
-            fail_rate = len(gs_projects[gs_projects['Status'] == 'Fail']) / len(gs_projects) * 100
+        if not self._gs_projects.empty:
+            fail_count = int(self._status_totals['Rows'].get('Fail', 0))
+            fail_rate = fail_count / len(self._gs_projects) * 100
             if fail_rate > 10:
-                recommendations.append(
+                yield (
                     f"   • High failure rate ({fail_rate:.1f}%) requires root cause analysis"
                 )
         
-        recommendations.append("")
+        yield ""
         
         # 2. Resource Allocation
-        recommendations.extend([
+        yield from [
             "2. RESOURCE ALLOCATION",
-            "-" * 40,
-        ])
+            _DASH40,
+        ]
         
         # Department efficiency
-        dept_costs = self.department_summary['TotalLaborCost'].sort_values(ascending=False)
-        top_cost_dept = dept_costs.index[0]
-        recommendations.append(
+        top_cost_dept = self.department_summary['TotalLaborCost'].idxmax()
+        yield (
             f"   • {top_cost_dept} has highest labor cost - evaluate resource utilization"
         )
         
         # Project distribution
+        num_projects = self.department_summary['NumProjects'].to_numpy()
         avg_projects_per_dept = self.department_summary['NumProjects'].mean()
-        overloaded_depts = self.department_summary[
-            self.department_summary['NumProjects'] > avg_projects_per_dept * 1.5
-        ]
-        if not overloaded_depts.empty:
-            recommendations.append(
-                f"   • Balance workload for {len(overloaded_depts)} overloaded departments"
+        overloaded_count = int(np.count_nonzero(num_projects > avg_projects_per_dept * 1.5))
+        if overloaded_count:
+            yield (
+                f"   • Balance workload for {overloaded_count} overloaded departments"
             )
         
-        recommendations.append("")
+        yield ""
         
         # 3. Financial Optimization
-        recommendations.extend([
+        yield from [
             "3. FINANCIAL OPTIMIZATION",
-            "-" * 40,
-        ])
+            _DASH40,
+        ]
         
         # Profit margin analysis
         avg_margin = self.analyses['profitability']['overall_metrics']['average_profit_margin']
         if avg_margin < 15:
-            recommendations.append(
+            yield (
                 f"   • Average profit margin ({avg_margin:.1f}%) below industry standard"
             )
-            recommendations.append(
+            yield (
                 "   • Consider pricing strategy review or cost reduction initiatives"
             )
         
         # Labor cost percentage
         labor_percentage = self._calculate_labor_percentage()
         if labor_percentage > 40:
-            recommendations.append(
+            yield (
                 f"   • High labor cost percentage ({labor_percentage:.1f}%) - explore automation"
             )
         
-        recommendations.append("")
+        yield ""
         
         # 4. Data Quality
-        recommendations.extend([
+        yield from [
             "4. DATA QUALITY IMPROVEMENTS",
-            "-" * 40,
+            _DASH40,
             "   • Standardize project code format across all departments",
             "   • Implement status tracking for ISS projects",
             "   • Ensure all work hours are properly coded to projects",
             "   • Regular data validation to prevent missing information",
             ""
-        ])
+        ]
         
         # 5. Strategic Initiatives
-        recommendations.extend([
+        yield from [
             "5. STRATEGIC INITIATIVES",
-            "-" * 40,
-        ])
+            _DASH40,
+        ]
         
         # High performers
         top_performers = self.analyses['efficiency']['top_efficient_projects']
         if not top_performers.empty:
-            recommendations.append(
+            yield (
                 "   • Analyze success factors of top-performing projects for replication"
             )
         
         # Project type comparison
-        type_profits = self.financial_summary.groupby('ProjectType')['Profit'].sum()
+        type_profits = self._type_group['Profit'].sum()
         if len(type_profits) > 1:
             best_type = type_profits.idxmax()
-            recommendations.append(
+            yield (
                 f"   • {best_type} projects show higher profitability - consider focus shift"
             )
         
-        recommendations.extend([
+        yield from [
             "",
-            "=" * 80,
+            _EQ80,
             "IMPLEMENTATION PRIORITY",
-            "=" * 80,
+            _EQ80,
             "",
             "HIGH PRIORITY (Immediate action required):",
             "  1. Address loss-making projects",
@@ -537,21 +633,23 @@ class ReportGenerator:
             "  2. Strategic portfolio rebalancing",
             "  3. Advanced analytics implementation",
             ""
-        ])
-        
-        # Save recommendations
-        output_path = os.path.join(self.output_dir, 'strategic_recommendations.txt')
+        ]
+    
+    @staticmethod
+    def _write_lines(output_path: str, lines: Iterable[str]):
+        """Stream report lines to disk without joining them in memory"""
+        lines = iter(lines)
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(recommendations))
-        
-        logger.info(f"Recommendations saved to {output_path}")
+            f.write(next(lines, ''))
+            f.writelines('\n' + line for line in lines)
     
     def _get_top_performer(self) -> Dict:
         """Get top performing project details"""
         if self.financial_summary.empty:
             return {}
         
-        top = self.financial_summary.nlargest(1, 'Profit').iloc[0]
+        profits = self.financial_summary['Profit'].to_numpy(dtype=float)
+        top = self.financial_summary.iloc[int(np.nanargmax(profits))]
         return {
             'project_code': top['ProjectCode'],
             'project_name': top['ProjectName'],
@@ -564,7 +662,8 @@ class ReportGenerator:
         if self.financial_summary.empty:
             return {}
         
-        concern = self.financial_summary.nsmallest(1, 'Profit').iloc[0]
+        profits = self.financial_summary['Profit'].to_numpy(dtype=float)
+        concern = self.financial_summary.iloc[int(np.nanargmin(profits))]
         return {
             'project_code': concern['ProjectCode'],
             'project_name': concern['ProjectName'],
@@ -583,12 +682,12 @@ class ReportGenerator:
     
     def _calculate_success_rate(self) -> float:
         """Calculate project success rate for GS projects"""
-        gs_projects = self.financial_summary[self.financial_summary['ProjectType'] == 'GS']
-        if gs_projects.empty:
+        if self._gs_projects.empty:
             return 0.0
         
-        success_count = len(gs_projects[gs_projects['Status'] == 'Success'])
-        total_count = len(gs_projects[gs_projects['Status'] != 'Unknown'])
+        rows = self._status_totals['Rows']
+        success_count = int(rows.get('Success', 0))
+        total_count = len(self._gs_projects) - int(rows.get('Unknown', 0))
         
         return (success_count / total_count * 100) if total_count > 0 else 0.0
     
@@ -603,7 +702,7 @@ class ReportGenerator:
 def main():
     """Test report generation"""
     from data_loader import DataLoader
-    from data_processor import DataProcessor
+    from data_processor import DataProcessor, LazyAnalyses
     
     # Load and process data
     loader = DataLoader()
@@ -614,10 +713,10 @@ def main():
     financial_summary = processor.calculate_all_metrics()
     
     # Get analyses
-    analyses = {
-        'efficiency': processor.get_efficiency_analysis(),
-        'profitability': processor.get_profitability_analysis()
-    }
+    analyses = LazyAnalyses({
+        'efficiency': processor.get_efficiency_analysis,
+        'profitability': processor.get_profitability_analysis
+    })
     
     # Generate reports
     generator = ReportGenerator(